@@ -3,7 +3,8 @@
 LPEC Utility Functions
 
 Shared functions for querying Linn DSM devices via LPEC (Linn Protocol for Eventing and Control).
-Used by both songcast_monitor.py and songcast_group.py for real-time state verification.
+Used by songcast_monitor.py and songcast_group.py for real-time state verification,
+and by find_linn_udn.py for UDN/Product discovery.
 
 LPEC Protocol:
 - Port: 23 (telnet)
@@ -15,102 +16,305 @@ References:
 - https://docs.linn.co.uk/wiki/images/3/32/LPEC_V2-5.pdf
 """
 
+import asyncio
+import functools
+import os
+import select
 import socket
 import re
 import time
-from typing import Dict, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
+# Precompiled LPEC patterns. query_receiver_state is hammered by the
+# wait_for_state polling loop, so compile once at import instead of paying
+# the re cache lookup on every call.
+# Patterns are bytes-mode: LPEC payloads are ASCII, so matching the raw
+# socket bytes skips a full UTF-8 decode pass per line. Only the captured
+# groups get decoded.
+_RE_EVENT = re.compile(rb'^EVENT\s+\d+\s+')
 
-def query_receiver_state(ip: str, timeout: float = 3.0) -> Optional[Dict[str, str]]:
+# Fixed literal for the initial state snapshot line. bytes.startswith on a
+# literal is far cheaper than invoking the regex engine, and the reader
+# already hands us whole lines, so no MULTILINE scan is needed.
+_EVENT0 = b'EVENT 0 '
+_RE_ALIVE_DS = re.compile(rb'ALIVE\s+Ds\s+([A-Fa-f0-9\-]+)')
+
+# Single fused alternation for LPEC variable/value pairs. One finditer pass
+# over the buffer replaces four independent re.search scans per EVENT line.
+_RE_KV = re.compile(
+    rb'(?P<k>TransportState|Sender|Status|ProtocolInfo|ProductName|ProductRoom)'
+    rb'\s+"(?P<v>[^"]*)"'
+)
+
+
+# LPEC variable name -> ReceiverState attribute
+_ATTR_BY_VAR = {
+    'TransportState': 'transport_state',
+    'Sender': 'sender',
+    'Status': 'status',
+    'ProtocolInfo': 'protocol_info',
+}
+
+
+class ReceiverState:
+    """
+    Snapshot of a device's Ds/Receiver service state.
+
+    Plain __slots__ class instead of a dict: attribute access is faster
+    than dict.get in the wait_for_state matching loop and each instance
+    is roughly half the size. (Spelled out by hand rather than as a
+    @dataclass(slots=True), which needs Python 3.10.)
+    """
+
+    __slots__ = ('transport_state', 'sender', 'status', 'protocol_info')
+
+    def __init__(self, transport_state: Optional[str] = None,
+                 sender: Optional[str] = None,
+                 status: Optional[str] = None,
+                 protocol_info: Optional[str] = None) -> None:
+        self.transport_state = transport_state
+        self.sender = sender
+        self.status = status
+        self.protocol_info = protocol_info
+
+    def __repr__(self) -> str:
+        return (f"ReceiverState(transport_state={self.transport_state!r}, "
+                f"sender={self.sender!r}, status={self.status!r}, "
+                f"protocol_info={self.protocol_info!r})")
+
+    @classmethod
+    def from_vars(cls, variables: Dict[str, str]) -> "ReceiverState":
+        """Build a snapshot from parsed LPEC variable/value pairs."""
+        state = cls()
+        for var, value in variables.items():
+            attr = _ATTR_BY_VAR.get(var)
+            if attr:
+                setattr(state, attr, value)
+        return state
+
+    def get(self, var: str) -> Optional[str]:
+        """Look up a value by its LPEC variable name (e.g. 'TransportState')."""
+        attr = _ATTR_BY_VAR.get(var)
+        return getattr(self, attr) if attr else None
+
+
+def _connect(ip: str, port: int, connect_timeout: float) -> socket.socket:
+    """
+    Open a TCP connection with a fast-fail connect timeout.
+
+    A non-blocking connect plus select keeps the connect timeout separate
+    from the read timeout, so unreachable hosts fail after connect_timeout
+    instead of blocking for the (longer) read timeout.
+    """
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setblocking(False)
+    try:
+        sock.connect((ip, port))
+    except BlockingIOError:
+        pass
+    _, writable, _ = select.select([], [sock], [], connect_timeout)
+    if not writable:
+        sock.close()
+        raise socket.timeout(f"connect to {ip}:{port} timed out")
+    err = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+    if err:
+        sock.close()
+        # OSError with an errno maps to the right subclass (e.g.
+        # ConnectionRefusedError), preserving callers' except branches
+        raise OSError(err, os.strerror(err))
+    sock.setblocking(True)
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    return sock
+
+
+class LpecSession:
+    """
+    Persistent LPEC subscription to a device service.
+
+    Connects and subscribes once, then parses EVENT updates as the device
+    pushes them. Callers that need to watch state over time (wait_for_state)
+    use this instead of re-running the connect/drain/subscribe handshake on
+    every poll - that is the subscribe-then-event model LPEC is designed for.
+
+    Example:
+        with LpecSession("172.24.32.210") as session:
+            state = session.next_event(timeout=2.0)
+    """
+
+    def __init__(self, ip: str, service: str = "Ds/Receiver", timeout: float = 3.0,
+                 connect_timeout: float = 1.0):
+        self.ip = ip
+        self.service = service
+        self.timeout = timeout
+        self.connect_timeout = connect_timeout
+        self.sock = None
+        self.state: Dict[str, str] = {}
+        self._rfile = None
+
+    def __enter__(self) -> "LpecSession":
+        self.connect()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        self.close()
+        return False
+
+    def connect(self) -> None:
+        """Connect, drain the ALIVE banner and subscribe to the service."""
+        sock = _connect(self.ip, 23, self.connect_timeout)
+        self.sock = sock
+        self._rfile = sock.makefile('rb', buffering=65536)
+
+        # Read initial ALIVE messages
+        deadline = time.monotonic() + 1.0
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            sock.settimeout(min(0.5, remaining))
+            try:
+                raw = self._rfile.readline()
+            except socket.timeout:
+                continue
+            if not raw:
+                break
+            if b'ALIVE Ds' in raw:
+                break
+
+        # Subscribe; leading blank line works around the LPEC first-command bug
+        sock.sendall(b"\r\nSUBSCRIBE " + self.service.encode('ascii') + b"\r\n")
+
+    def next_event(self, timeout: float) -> Optional[ReceiverState]:
+        """
+        Block until the next EVENT line arrives (or timeout), merge its
+        variables into the session state and return a ReceiverState
+        snapshot of it. Returns None if no event arrived before the
+        timeout or the connection closed.
+        """
+        # Bind hot lookups to locals: LOAD_FAST beats LOAD_GLOBAL+LOAD_ATTR
+        # on every iteration of a tight polling loop
+        monotonic = time.monotonic
+        settimeout = self.sock.settimeout
+        readline = self._rfile.readline
+        match_event = _RE_EVENT.match
+        deadline = monotonic() + timeout
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                return None
+            settimeout(min(0.5, remaining))
+            try:
+                raw = readline()
+            except socket.timeout:
+                continue
+            if not raw:
+                return None
+            # Cheap literal prefilter: every LPEC var/value pair is quoted,
+            # so lines without a quote (ALIVE, blank, CRLF noise) can skip
+            # the regex engine entirely
+            if b'"' not in raw:
+                continue
+            if match_event(raw):
+                for m in _RE_KV.finditer(raw):
+                    self.state[m.group('k').decode('ascii')] = m.group('v').decode('utf-8', 'ignore')
+                return ReceiverState.from_vars(self.state)
+
+    def close(self) -> None:
+        if self._rfile is not None:
+            try:
+                self._rfile.close()
+            except Exception:
+                pass
+            self._rfile = None
+        if self.sock is not None:
+            try:
+                self.sock.close()
+            except Exception:
+                pass
+            self.sock = None
+
+
+def query_receiver_state(ip: str, timeout: float = 3.0,
+                         connect_timeout: float = 1.0) -> Optional[ReceiverState]:
     """
     Query the current Receiver service state of a device via LPEC.
-    
+
     Args:
         ip: Device IP address
-        timeout: Connection and read timeout in seconds
-        
+        timeout: Read timeout in seconds
+        connect_timeout: Connect timeout in seconds (fast-fail for offline hosts)
+
     Returns:
-        Dictionary with Receiver state variables (TransportState, Sender, Status, ProtocolInfo)
+        ReceiverState snapshot (TransportState, Sender, Status, ProtocolInfo)
         or None if connection fails
-        
+
     Example:
         state = query_receiver_state("172.24.32.210")
-        if state and state.get('TransportState') == 'Playing':
+        if state and state.transport_state == 'Playing':
             print("Device is playing")
     """
     try:
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.settimeout(timeout)
-        
-        # Connect to LPEC port
-        sock.connect((ip, 23))
-        
-        # Read initial ALIVE messages
-        buffer = ""
-        start = time.time()
-        while time.time() - start < 1.0:
+        # Connect to LPEC port (fast-fail connect, distinct from read timeout)
+        sock = _connect(ip, 23, connect_timeout)
+
+        # LPEC is line-oriented: use a buffered reader so line splitting
+        # happens in C instead of re-scanning a growing string per recv
+        rfile = sock.makefile('rb', buffering=65536)
+
+        # Bind hot lookups to locals for the read loops below (LOAD_FAST is
+        # markedly cheaper than LOAD_GLOBAL+LOAD_ATTR per iteration)
+        monotonic = time.monotonic
+        settimeout = sock.settimeout
+        readline = rfile.readline
+
+        # Read initial ALIVE messages. Monotonic deadlines are immune to
+        # wall-clock jumps; each readline timeout is sized to the time left.
+        deadline = monotonic() + 1.0
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            settimeout(min(0.5, remaining))
             try:
-                chunk = sock.recv(4096).decode('utf-8', errors='ignore')
-                if not chunk:
-                    break
-                buffer += chunk
-                if 'ALIVE Ds' in buffer:
-                    break
+                raw = readline()
             except socket.timeout:
+                continue
+            if not raw:
                 break
-        
-        # Workaround for LPEC first-command bug
-        try:
-            sock.sendall("\r\n".encode('utf-8'))
-            time.sleep(0.05)
-        except Exception:
-            pass
-        
-        # Subscribe to Ds/Receiver
-        sock.sendall("SUBSCRIBE Ds/Receiver\r\n".encode('utf-8'))
-        
-        # Read initial EVENT 0 with current state
-        buffer = ""
-        start = time.time()
-        while time.time() - start < timeout:
+            if b'ALIVE Ds' in raw:
+                break
+
+        # Subscribe to Ds/Receiver. The leading blank line works around the
+        # LPEC first-command bug; sending both in one write (with Nagle
+        # disabled above) saves a round trip per poll.
+        sock.sendall(b"\r\nSUBSCRIBE Ds/Receiver\r\n")
+
+        # Read until the initial EVENT 0 state snapshot arrives. The reader
+        # yields whole lines, so a literal startswith is all the detection
+        # needed - the regex engine only runs for the final parse.
+        variables = {}
+        deadline = monotonic() + timeout
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            settimeout(min(0.5, remaining))
             try:
-                chunk = sock.recv(4096).decode('utf-8', errors='ignore')
-                if not chunk:
-                    break
-                buffer += chunk
-                # Look for EVENT 0
-                if re.search(r'^EVENT\s+0\s+', buffer, re.MULTILINE):
-                    break
+                raw = readline()
             except socket.timeout:
+                continue
+            if not raw:
                 break
-        
+            if raw.startswith(_EVENT0):
+                # One finditer pass over the EVENT line replaces four
+                # independent per-variable searches
+                for m in _RE_KV.finditer(raw):
+                    variables[m.group('k').decode('ascii')] = m.group('v').decode('utf-8', 'ignore')
+                break
+
         sock.close()
-        
-        # Parse state from EVENT 0
-        state = {}
-        for line in buffer.splitlines():
-            line = line.strip()
-            if not line.startswith("EVENT"):
-                continue
-            
-            # Extract variables
-            m = re.search(r'TransportState\s+"([^"]*)"', line)
-            if m:
-                state['TransportState'] = m.group(1)
-            
-            m = re.search(r'Sender\s+"([^"]*)"', line)
-            if m:
-                state['Sender'] = m.group(1)
-            
-            m = re.search(r'Status\s+"([^"]*)"', line)
-            if m:
-                state['Status'] = m.group(1)
-            
-            m = re.search(r'ProtocolInfo\s+"([^"]*)"', line)
-            if m:
-                state['ProtocolInfo'] = m.group(1)
-        
-        return state if state else None
+
+        return ReceiverState.from_vars(variables) if variables else None
         
     except socket.timeout:
         return None
@@ -120,19 +324,189 @@ def query_receiver_state(ip: str, timeout: float = 3.0) -> Optional[Dict[str, st
         return None
 
 
-def wait_for_state(ip: str, expected_state: Dict[str, str], timeout: float = 10.0, poll_interval: float = 0.5) -> Tuple[bool, Optional[Dict[str, str]]]:
+async def aquery_receiver_state(ip: str, timeout: float = 3.0,
+                                connect_timeout: float = 1.0) -> Optional[ReceiverState]:
+    """
+    Async variant of query_receiver_state using asyncio streams.
+
+    The workload is pure I/O wait, so N devices can be queried concurrently
+    on one thread - see aquery_receiver_states for the bulk entry point.
+    """
+    writer = None
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip, 23), connect_timeout)
+        writer.get_extra_info('socket').setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+        # Drain the ALIVE banner, then subscribe (leading blank line works
+        # around the LPEC first-command bug, same as the sync path)
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            raw = await asyncio.wait_for(reader.readline(), remaining)
+            if not raw:
+                return None
+            if b'ALIVE Ds' in raw:
+                break
+        writer.write(b"\r\nSUBSCRIBE Ds/Receiver\r\n")
+        await writer.drain()
+
+        # Read until the initial EVENT 0 snapshot arrives
+        variables: Dict[str, str] = {}
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            raw = await asyncio.wait_for(reader.readline(), remaining)
+            if not raw:
+                break
+            if raw.startswith(_EVENT0):
+                for m in _RE_KV.finditer(raw):
+                    variables[m.group('k').decode('ascii')] = m.group('v').decode('utf-8', 'ignore')
+                break
+
+        return ReceiverState.from_vars(variables) if variables else None
+
+    except (asyncio.TimeoutError, OSError):
+        return None
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+async def aquery_receiver_states(ips, timeout: float = 3.0,
+                                 connect_timeout: float = 1.0) -> List[Optional[ReceiverState]]:
+    """
+    Query several devices' Receiver state concurrently.
+
+    Returns one ReceiverState (or None) per IP, in input order. Run it with
+    asyncio.run() from sync code:
+
+        states = asyncio.run(aquery_receiver_states(["172.24.32.210", ...]))
+    """
+    return await asyncio.gather(
+        *(aquery_receiver_state(ip, timeout=timeout, connect_timeout=connect_timeout)
+          for ip in ips))
+
+
+def discover_linn_udn(ip_address, port=23, timeout=5, connect_timeout=1.0):
+    """
+    Connect to a Linn DSM device via LPEC (telnet port 23) and extract:
+      - UDN from the initial 'ALIVE Ds' message
+      - ProductRoom and ProductName via SUBSCRIBE Ds/Product initial EVENT
+
+    Returns a tuple: (udn or None, product_room or None, product_name or None)
+    """
+    try:
+        # Create socket connection (fast-fail connect, distinct from read timeout)
+        print(f"Connecting to {ip_address}:{port}...")
+        sock = _connect(ip_address, port, connect_timeout)
+
+        # LPEC is line-oriented: read line-at-a-time via a buffered reader
+        # instead of accumulating chunks and re-scanning the whole buffer
+        rfile = sock.makefile('rb', buffering=65536)
+
+        # Bind hot lookups to locals for the read loops below
+        monotonic = time.monotonic
+        settimeout = sock.settimeout
+        readline = rfile.readline
+
+        # One event-driven loop for both phases: wait for ALIVE, send the
+        # Ds/Product SUBSCRIBE the moment it arrives (leading blank line
+        # works around the first-command LPEC bug), then keep consuming
+        # until all three fields are known or the deadline hits. Overlapping
+        # the send with the reads saves a timeout grace period per phase and
+        # halves the loop boilerplate. Debug output accumulates into a
+        # bytearray and is decoded once at the end.
+        received = bytearray()
+        deadline = monotonic() + timeout
+        udn = None
+        product_room = None
+        product_name = None
+        subscribed = False
+        while True:
+            remaining = deadline - monotonic()
+            if remaining <= 0:
+                break
+            settimeout(min(0.5, remaining))
+            try:
+                raw = readline()
+            except socket.timeout:
+                continue
+            if not raw:
+                break
+            received.extend(raw)
+            if not subscribed:
+                # Example: ALIVE Ds 4c494e4e-...013f
+                m = _RE_ALIVE_DS.search(raw)
+                if m:
+                    udn = m.group(1).decode('ascii')
+                    sock.sendall(b"\r\nSUBSCRIBE Ds/Product\r\n")
+                    subscribed = True
+            elif b'"' in raw:
+                # ProductName/ProductRoom arrive in the initial EVENT 0;
+                # quote-free lines can't carry var/value pairs, so they
+                # skip the regex pass entirely
+                for m in _RE_KV.finditer(raw):
+                    key = m.group('k')
+                    if key == b'ProductName':
+                        product_name = m.group('v').decode('utf-8', 'ignore')
+                    elif key == b'ProductRoom':
+                        product_room = m.group('v').decode('utf-8', 'ignore')
+                if product_name is not None and product_room is not None:
+                    break
+
+        buffer = received.decode('utf-8', errors='ignore')
+        if buffer.strip():
+            print(f"Received:\n{buffer.strip()}")
+
+        if udn:
+            print(f"\n✓ Found UDN: {udn}")
+        else:
+            print("\n✗ No UDN found in ALIVE message(s)")
+            print("Raw data received:")
+            print(repr(buffer))
+
+        return udn, product_room, product_name
+
+    except socket.timeout:
+        print(f"✗ Timeout connecting to {ip_address}:{port}")
+        return None, None, None
+    except ConnectionRefusedError:
+        print(f"✗ Connection refused to {ip_address}:{port}")
+        print("  Device may not have telnet enabled or may be offline")
+        return None, None, None
+    except Exception as e:
+        print(f"✗ Error connecting to {ip_address}: {e}")
+        return None, None, None
+    finally:
+        try:
+            sock.close()
+        except Exception:
+            pass
+
+
+def wait_for_state(ip: str, expected_state: Dict[str, str], timeout: float = 10.0,
+                   poll_interval: float = 0.5,
+                   fail_states: Optional[Dict[str, str]] = None) -> Tuple[bool, Optional[ReceiverState]]:
     """
     Poll device state until expected conditions are met or timeout.
-    
+
     Args:
         ip: Device IP address
         expected_state: Dictionary of variable:value pairs to match (e.g., {'TransportState': 'Playing'})
         timeout: Maximum time to wait in seconds
         poll_interval: Time between polls in seconds
-        
+        fail_states: Optional variable:value pairs that mean the device will
+            never reach expected_state (e.g., {'Status': 'Disconnected'});
+            return immediately instead of burning the full timeout
+
     Returns:
-        Tuple of (success: bool, final_state: dict or None)
-        
+        Tuple of (success: bool, final_state: ReceiverState or None)
+
     Example:
         success, state = wait_for_state(
             "172.24.32.210",
@@ -142,31 +516,155 @@ def wait_for_state(ip: str, expected_state: Dict[str, str], timeout: float = 10.
         if success:
             print("Device reached expected state")
     """
-    start = time.time()
+    deadline = time.monotonic() + timeout
     last_state = None
-    
-    while time.time() - start < timeout:
-        state = query_receiver_state(ip, timeout=2.0)
-        last_state = state
-        
-        if state:
-            # Check if all expected conditions are met
-            all_match = True
-            for key, expected_value in expected_state.items():
-                actual_value = state.get(key)
-                if actual_value != expected_value:
-                    all_match = False
-                    break
-            
-            if all_match:
-                return True, state
-        
-        time.sleep(poll_interval)
-    
+
+    # Hold one subscription open and consume pushed EVENT updates instead of
+    # re-running the TCP + subscribe handshake on every poll. poll_interval
+    # is only used as a reconnect backoff if the connection drops.
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            with LpecSession(ip, timeout=2.0) as session:
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    state = session.next_event(timeout=remaining)
+                    if state is None:
+                        # Timed out or connection closed
+                        break
+                    last_state = state
+                    if all(state.get(k) == v for k, v in expected_state.items()):
+                        return True, state
+                    if fail_states and any(state.get(k) == v for k, v in fail_states.items()):
+                        return False, state
+        except Exception:
+            pass
+        if deadline - time.monotonic() > 0:
+            time.sleep(poll_interval)
+
     # Timeout - return last known state
     return False, last_state
 
 
+async def await_receiver_state(ip: str, predicate, timeout: float = 4.0,
+                               connect_timeout: float = 1.0) -> Tuple[bool, Optional[ReceiverState]]:
+    """
+    Await pushed Receiver EVENTs until predicate(state) is true or timeout.
+
+    Async, push-driven cousin of wait_for_state for callers already inside
+    an event loop: one subscription, no polling - the function returns on
+    the first event whose accumulated state satisfies the predicate.
+
+    Args:
+        ip: Device IP address
+        predicate: Callable taking a ReceiverState, returning truthy on match
+        timeout: Maximum time to wait in seconds
+        connect_timeout: Connect timeout in seconds
+
+    Returns:
+        Tuple of (matched: bool, last_state: ReceiverState or None)
+    """
+    writer = None
+    last: Optional[ReceiverState] = None
+    variables: Dict[str, str] = {}
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(ip, 23), connect_timeout)
+        writer.get_extra_info('socket').setsockopt(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        deadline = time.monotonic() + timeout
+        subscribed = False
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False, last
+            raw = await asyncio.wait_for(reader.readline(), remaining)
+            if not raw:
+                return False, last
+            if not subscribed:
+                if b'ALIVE Ds' in raw:
+                    writer.write(b"\r\nSUBSCRIBE Ds/Receiver\r\n")
+                    await writer.drain()
+                    subscribed = True
+                continue
+            if b'"' not in raw:
+                continue
+            matched_any = False
+            for m in _RE_KV.finditer(raw):
+                variables[m.group('k').decode('ascii')] = m.group('v').decode('utf-8', 'ignore')
+                matched_any = True
+            if not matched_any:
+                continue
+            # Accumulate across events so partial updates still evaluate
+            # against the full known state
+            last = ReceiverState.from_vars(variables)
+            if predicate(last):
+                return True, last
+    except (asyncio.TimeoutError, OSError):
+        return False, last
+    finally:
+        if writer is not None:
+            writer.close()
+
+
+@functools.lru_cache(maxsize=32)
+def _var_pattern(var: str):
+    """Compiled bytes pattern extracting a single quoted LPEC variable value."""
+    return re.compile(re.escape(var).encode('ascii') + rb'\s+"([^"]*)"')
+
+
+def query_variable(ip: str, var: str, timeout: float = 3.0,
+                   connect_timeout: float = 1.0) -> Optional[str]:
+    """
+    Query a single Receiver service variable via LPEC.
+
+    Cheaper than query_receiver_state when only one variable matters: the
+    read loop returns (and closes the socket) as soon as the variable is
+    seen rather than waiting for the complete EVENT 0.
+
+    Args:
+        ip: Device IP address
+        var: LPEC variable name (e.g. 'TransportState')
+        timeout: Read timeout in seconds
+        connect_timeout: Connect timeout in seconds
+
+    Returns:
+        The variable value, or None if unavailable
+    """
+    pat = _var_pattern(var)
+    try:
+        with LpecSession(ip, timeout=timeout, connect_timeout=connect_timeout) as session:
+            monotonic = time.monotonic
+            settimeout = session.sock.settimeout
+            readline = session._rfile.readline
+            search = pat.search
+            deadline = monotonic() + timeout
+            while True:
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    return None
+                settimeout(min(0.5, remaining))
+                try:
+                    raw = readline()
+                except socket.timeout:
+                    continue
+                if not raw:
+                    return None
+                # Var/value pairs are always quoted - skip the regex for
+                # quote-free banner/noise lines
+                if b'"' not in raw:
+                    continue
+                m = search(raw)
+                if m:
+                    return m.group(1).decode('utf-8', 'ignore')
+    except Exception:
+        return None
+
+
 def check_transport_playing(ip: str, timeout: float = 3.0) -> bool:
     """
     Quick check if device TransportState is Playing or Buffering.
@@ -178,11 +676,7 @@ def check_transport_playing(ip: str, timeout: float = 3.0) -> bool:
     Returns:
         True if device is Playing or Buffering, False otherwise
     """
-    state = query_receiver_state(ip, timeout=timeout)
-    if not state:
-        return False
-    
-    transport = state.get('TransportState', '').lower()
+    transport = (query_variable(ip, 'TransportState', timeout=timeout) or '').lower()
     return transport in ('playing', 'buffering')
 
 
@@ -203,51 +697,65 @@ def check_sender_uri(ip: str, expected_scheme: str = 'ohz', timeout: float = 3.0
         if matches:
             print(f"Device using ohz protocol: {uri}")
     """
-    state = query_receiver_state(ip, timeout=timeout)
-    if not state:
+    sender_uri = query_variable(ip, 'Sender', timeout=timeout)
+    if sender_uri is None:
         return False, None
-    
-    sender_uri = state.get('Sender', '')
-    matches = sender_uri.startswith(f"{expected_scheme}://")
-    
+
+    prefix = _OHZ_PFX if expected_scheme == 'ohz' else f"{expected_scheme}://"
+    matches = sender_uri.startswith(prefix)
+
     return matches, sender_uri
 
 
-def format_state_summary(state: Optional[Dict[str, str]]) -> str:
-    """
-    Format state dictionary into human-readable summary.
-    
-    Args:
-        state: State dictionary from query_receiver_state()
-        
-    Returns:
-        Formatted string summary
-    """
-    if not state:
-        return "No state available"
-    
+# URI scheme prefixes, precomputed so hot paths don't rebuild them per call
+_OHZ_PFX = 'ohz://'
+_OHSONGCAST_PFX = 'ohSongcast://'
+
+
+@functools.lru_cache(maxsize=256)
+def _fmt(transport: Optional[str], sender: Optional[str], status: Optional[str]) -> str:
+    """Build the summary string for one (transport, sender, status) triple."""
     parts = []
-    
-    if 'TransportState' in state:
-        parts.append(f"Transport={state['TransportState']}")
-    
-    if 'Sender' in state:
-        sender = state['Sender']
-        if sender.startswith('ohz://'):
+
+    if transport is not None:
+        parts.append(f"Transport={transport}")
+
+    if sender is not None:
+        if sender.startswith(_OHZ_PFX):
             parts.append("Sender=ohz://...")
-        elif sender.startswith('ohSongcast://'):
+        elif sender.startswith(_OHSONGCAST_PFX):
             parts.append("Sender=ohSongcast://...")
         elif sender:
             parts.append(f"Sender={sender[:30]}...")
         else:
             parts.append("Sender=(empty)")
-    
-    if 'Status' in state:
-        parts.append(f"Status={state['Status']}")
-    
+
+    if status is not None:
+        parts.append(f"Status={status}")
+
     return ", ".join(parts) if parts else "No data"
 
 
+def format_state_summary(state: Optional[ReceiverState]) -> str:
+    """
+    Format a ReceiverState into a human-readable summary.
+
+    Monitoring loops call this with the same few states over and over
+    (devices sit in Playing/Yes for long stretches), so the string work is
+    memoized per (transport, sender, status) triple.
+
+    Args:
+        state: ReceiverState from query_receiver_state()
+
+    Returns:
+        Formatted string summary
+    """
+    if not state:
+        return "No state available"
+
+    return _fmt(state.transport_state, state.sender, state.status)
+
+
 if __name__ == "__main__":
     import sys
     
@@ -264,8 +772,10 @@ if __name__ == "__main__":
         print("\n✓ State retrieved:")
         print(f"  {format_state_summary(state)}")
         print("\nFull state:")
-        for key, value in state.items():
-            print(f"  {key}: {value}")
+        for var in _ATTR_BY_VAR:
+            value = state.get(var)
+            if value is not None:
+                print(f"  {var}: {value}")
     else:
         print("\n✗ Failed to retrieve state")
         print("  Device may be offline or telnet disabled")
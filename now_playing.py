@@ -44,43 +44,109 @@ Notes:
 """
 
 import argparse
+import atexit
+import functools
 import sys
 import asyncio
 import html
 import re
 import os
 import json
-import xml.etree.ElementTree as ET
+import time
 from pathlib import Path
-from typing import Optional, Dict, List
-from urllib.parse import urlparse, parse_qs
+from typing import Optional, Dict, List, Tuple
+from urllib.parse import urlparse, unquote_plus
+
+# openhomedevice (and the aiohttp stack it drags in) costs hundreds of ms to
+# import - far more than a --help invocation or a cron cold start should pay.
+# The sentinels stay None until first use; _import_openhome() fills them in.
+Device = None
+didl_lite = None
+aiohttp = None
+
+
+def _import_openhome() -> None:
+    """Import openhomedevice/aiohttp on first use; sentinels stay None on failure."""
+    global Device, didl_lite, aiohttp
+    if Device is not None:
+        return
+    try:
+        from openhomedevice.device import Device as _Device
+        from openhomedevice import didl_lite as _didl_lite
+    except Exception:
+        return
+    Device = _Device
+    didl_lite = _didl_lite
+    try:
+        import aiohttp as _aiohttp
+    except Exception:
+        return
+    aiohttp = _aiohttp
+
+# Precompiled patterns, hoisted to module scope so per-call invocations skip
+# re's cache lookup and pattern revalidation.
+#
+# The DIDL fields are matched by one fused alternation walked with finditer:
+# a single pass over the metadata string instead of four independent scans.
+# Tags may carry attributes (inline xmlns declarations are common in Linn
+# DIDL), so tolerate them in the fast path rather than falling through to
+# the XML parser for such payloads.
+_RE_DIDL = re.compile(r"<(dc:title|upnp:artist|upnp:album|upnp:channelName)(?:\s[^>]*)?>([^<]+)</\1>")
+_DIDL_KEY_MAP = {
+    "dc:title": "title",
+    "upnp:artist": "artist",
+    "upnp:album": "album",
+    "upnp:channelName": "channel",
+}
+_RE_SPLIT = re.compile(r"[\s,;]+")
+
+_QUOTES = ('"', "'")
+
+# Sender Uri splitter: capture the path (sender UDN) and raw query string in
+# one match instead of paying urlparse + parse_qs (which builds a dict of
+# lists) on the Songcast hot path. _SENDER_KV_RE then pulls the room/name
+# params straight out of the query.
+_SENDER_URI_RE = re.compile(r"^[A-Za-z][A-Za-z0-9+.\-]*://[^/?]*/?([^?]*)(?:\?(.*))?$")
+_SENDER_KV_RE = re.compile(r"(?:^|&)(room|name)=([^&]*)", re.IGNORECASE)
+
+# Transport states that count as actively receiving for grouping purposes
+_ACTIVE_TS = {"playing", "buffering", "connecting"}
+
+# Namespaced tag -> result key for parse_didl's XML fallback
+_DIDL_XML_TAGS = {
+    "{http://purl.org/dc/elements/1.1/}title": "title",
+    "{urn:schemas-upnp-org:metadata-1-0/upnp/}artist": "artist",
+    "{urn:schemas-upnp-org:metadata-1-0/upnp/}album": "album",
+    "{urn:schemas-upnp-org:metadata-1-0/upnp/}channelName": "channel",
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _load_env_cached(path: str, mtime: float) -> Tuple[Tuple[str, str], ...]:
+    """Parse a .env file; memoized on (path, mtime) so re-imports and
+    long-running hosts don't re-read an unchanged file. Returns an immutable
+    tuple of items - callers build their own dict."""
+    env: Dict[str, str] = {}
+    # One read + splitlines beats the file-iterator protocol's per-line
+    # method dispatch for a file this small and keeps the parse loop tight
+    for raw in Path(path).read_text().splitlines():
+        line = raw.strip()
+        if not line or line.startswith("#"):
+            continue
+        key, sep, val = line.partition("=")
+        if not sep:
+            continue
+        key = key.strip()
+        val = val.strip()
+        if len(val) >= 2 and val[0] == val[-1] and val.startswith(_QUOTES):
+            val = val[1:-1]
+        env[key] = val
+    return tuple(env.items())
 
-try:
-    from openhomedevice.device import Device
-    from openhomedevice import didl_lite
-except Exception:
-    Device = None
-    didl_lite = None
 
 def _load_env(path: str) -> Dict[str, str]:
-    env: Dict[str, str] = {}
-    try:
-        with open(path, "r") as f:
-            for raw in f:
-                line = raw.strip()
-                if not line or line.startswith("#"):
-                    continue
-                key, sep, val = line.partition("=")
-                if not sep:
-                    continue
-                key = key.strip()
-                val = val.strip()
-                if (val.startswith('"') and val.endswith('"')) or (val.startswith("'") and val.endswith("'")):
-                    val = val[1:-1]
-                env[key] = val
-    except FileNotFoundError:
-        raise
-    return env
+    # os.stat raises FileNotFoundError for missing files, same as open did
+    return dict(_load_env_cached(path, os.stat(path).st_mtime))
 
 
 def load_devices_from_env(env_path: Optional[str] = None) -> List[Dict[str, str]]:
@@ -91,10 +157,21 @@ def load_devices_from_env(env_path: Optional[str] = None) -> List[Dict[str, str]
 
     The default path is .env next to this script. Can be overridden by setting
     LINN_ENV_PATH in the environment or passing env_path.
+
+    Parsing is memoized on (path, mtime); each call returns a fresh list of
+    dicts so callers can mutate their copy safely.
     """
     default_path = str(Path(__file__).parent / ".env")
     path = env_path or os.environ.get("LINN_ENV_PATH") or default_path
-    env = _load_env(path)
+    return [
+        {"ip": ip, "udn": udn}
+        for ip, udn in _load_devices_cached(path, os.stat(path).st_mtime)
+    ]
+
+
+@functools.lru_cache(maxsize=None)
+def _load_devices_cached(path: str, mtime: float) -> Tuple[Tuple[str, str], ...]:
+    env = dict(_load_env_cached(path, mtime))
     devices: List[Dict[str, str]] = []
 
     # Preferred: lines like DEVICE_1=172.24.32.211 4c49..., DEVICE_2=...
@@ -105,7 +182,7 @@ def load_devices_from_env(env_path: Optional[str] = None) -> List[Dict[str, str]
             if not line:
                 continue
             # allow separators: space, comma, or semicolon
-            parts = re.split(r"[\s,;]+", line)
+            parts = _RE_SPLIT.split(line)
             if len(parts) >= 2:
                 ip, udn = parts[0], parts[1]
                 if ip and udn:
@@ -131,7 +208,7 @@ def load_devices_from_env(env_path: Optional[str] = None) -> List[Dict[str, str]
 
     if not devices:
         raise ValueError(f"No devices found in {path}. Define DEVICE entries or DEVICES_JSON.")
-    return devices
+    return tuple((d["ip"], d["udn"]) for d in devices)
 
 
 # Ordered list of devices to query (names are resolved automatically) loaded from .env.
@@ -140,11 +217,174 @@ def load_devices_from_env(env_path: Optional[str] = None) -> List[Dict[str, str]
 # caches them in NAME_CACHE so Songcast sender names can be mapped by UDN.
 DEVICES = load_devices_from_env()
 
-# Cache resolved names by UDN during a single run.
+# O(1) UDN -> IP index for Songcast sender resolution; the alternative is a
+# linear DEVICES scan on every unknown sender UDN.
+_DEV_BY_UDN: Dict[str, str] = {d["udn"]: d["ip"] for d in DEVICES}
+
+# Cache resolved names by UDN.
 #
 # Used to label Songcast senders when only their UDN is available in Sender Uri.
+# Persisted to a JSON sidecar between runs: UDN -> name mappings rarely change,
+# and a warm hit saves a device.xml fetch plus a name SOAP call (up to 2s each)
+# per Songcast-grouped device. Entries for UDNs no longer in DEVICES are
+# dropped at load so stale devices don't linger.
 NAME_CACHE: Dict[str, str] = {}
 
+_NAME_CACHE_PATH = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    / "openhome_names.json"
+)
+
+try:
+    with open(_NAME_CACHE_PATH, "r") as _f:
+        _known_udns = {d["udn"] for d in DEVICES}
+        NAME_CACHE.update(
+            (udn, name)
+            for udn, name in json.load(_f).items()
+            if isinstance(name, str) and udn in _known_udns
+        )
+except Exception:
+    pass
+
+
+def _save_name_cache() -> None:
+    """Write NAME_CACHE back to the cache file; best-effort.
+
+    Writes to a temp file and os.replace()s it into place so a crash
+    mid-write can't leave a truncated cache behind.
+    """
+    if not NAME_CACHE:
+        return
+    try:
+        _NAME_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _NAME_CACHE_PATH.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(NAME_CACHE, f)
+        os.replace(tmp, _NAME_CACHE_PATH)
+    except Exception:
+        pass
+
+
+atexit.register(_save_name_cache)
+
+# Exponentially weighted moving average of each device's SOAP round-trip
+# time, keyed by UDN. Timeouts derive from it (max(floor, factor * EWMA))
+# instead of a flat 2s, so responsive devices fail fast when they stall
+# while genuinely slow networks keep working. Persisted in the same XDG
+# cache directory as NAME_CACHE for warm starts.
+_RTT: Dict[str, float] = {}
+
+_RTT_CACHE_PATH = _NAME_CACHE_PATH.parent / "openhome_rtt.json"
+
+try:
+    with open(_RTT_CACHE_PATH, "r") as _f:
+        _RTT.update({k: float(v) for k, v in json.load(_f).items()})
+except Exception:
+    pass
+
+
+def _save_rtt_cache() -> None:
+    """Write _RTT back to its cache file; best-effort.
+
+    Same temp-file + os.replace() dance as _save_name_cache so a crash
+    mid-write can't leave a truncated cache behind.
+    """
+    if not _RTT:
+        return
+    try:
+        _RTT_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp = _RTT_CACHE_PATH.with_suffix(".tmp")
+        with open(tmp, "w") as f:
+            json.dump(_RTT, f)
+        os.replace(tmp, _RTT_CACHE_PATH)
+    except Exception:
+        pass
+
+
+atexit.register(_save_rtt_cache)
+
+
+# asyncio.timeout is 3.11+; older interpreters take the wait_for path below
+_HAS_ASYNCIO_TIMEOUT = hasattr(asyncio, "timeout")
+
+
+async def _timed_call(udn: str, coro, floor: float = 0.25, factor: float = 4.0,
+                      default: float = 2.0):
+    """Await coro under a timeout adapted to the device's observed RTT.
+
+    Successful calls feed the EWMA (alpha 0.2); until a sample exists the
+    flat default applies.
+    """
+    ewma = _RTT.get(udn)
+    timeout = default if ewma is None else max(floor, factor * ewma)
+    t0 = time.perf_counter()
+    if _HAS_ASYNCIO_TIMEOUT:
+        # asyncio.timeout arms a plain loop callback instead of wrapping
+        # the coroutine in a new Task the way wait_for does - one less
+        # allocation and scheduler hop per timed call
+        async with asyncio.timeout(timeout):
+            result = await coro
+    else:
+        result = await asyncio.wait_for(coro, timeout)
+    elapsed = time.perf_counter() - t0
+    _RTT[udn] = elapsed if ewma is None else (0.2 * elapsed + 0.8 * ewma)
+    return result
+
+
+# Pool of initialized Device objects keyed by (ip, udn). dev.init() fetches
+# and parses device.xml over HTTP - the most expensive per-device startup
+# cost - so batched or repeated queries within a process reuse the instance
+# instead of re-discovering.
+_DEVICE_POOL: Dict[Tuple[str, str], "Device"] = {}
+
+
+# One keep-alive HTTP session shared by every Device: SOAP payloads are tiny,
+# so the TCP handshake dominates per-call latency unless connections are
+# reused. Created lazily (sessions must be built inside a running loop) and
+# closed by main_async.
+_HTTP_SESSION: Optional["aiohttp.ClientSession"] = None
+
+
+def _get_http_session() -> Optional["aiohttp.ClientSession"]:
+    global _HTTP_SESSION
+    if aiohttp is None:
+        return None
+    if _HTTP_SESSION is None or _HTTP_SESSION.closed:
+        _HTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=0, keepalive_timeout=60, ttl_dns_cache=300)
+        )
+    return _HTTP_SESSION
+
+
+async def _close_http_session() -> None:
+    global _HTTP_SESSION
+    if _HTTP_SESSION is not None and not _HTTP_SESSION.closed:
+        await _HTTP_SESSION.close()
+    _HTTP_SESSION = None
+    # Pooled Devices are bound to the session just closed; drop them so a
+    # later query in the same process rebuilds against a fresh session
+    # instead of failing on a closed one.
+    _DEVICE_POOL.clear()
+
+
+async def _get_device(ip: str, udn: str) -> "Device":
+    """Return a pooled, initialized Device for (ip, udn), creating on miss."""
+    dev = _DEVICE_POOL.get((ip, udn))
+    if dev is None:
+        location = f"http://{ip}:55178/{udn}/Upnp/device.xml"
+        session = _get_http_session()
+        if session is not None:
+            try:
+                dev = Device(location, aiohttp_session=session)
+            except TypeError:
+                # Older openhomedevice without session injection
+                dev = Device(location)
+        else:
+            dev = Device(location)
+        await dev.init()
+        _DEVICE_POOL[(ip, udn)] = dev
+    return dev
+
 
 def parse_didl(didl: str) -> Dict[str, Optional[str]]:
     """Parse a DIDL-Lite metadata string to a minimal dict.
@@ -157,44 +397,118 @@ def parse_didl(didl: str) -> Dict[str, Optional[str]]:
     """
     if not didl:
         return {"title": None, "artist": None, "album": None, "channel": None}
-    didl = html.unescape(didl).strip()
-    # Regex fast path
-    m_title = re.search(r"<dc:title>([^<]+)</dc:title>", didl)
-    m_artist = re.search(r"<upnp:artist>([^<]+)</upnp:artist>", didl)
-    m_album = re.search(r"<upnp:album>([^<]+)</upnp:album>", didl)
-    m_channel = re.search(r"<upnp:channelName>([^<]+)</upnp:channelName>", didl)
-    if m_title or m_artist or m_album or m_channel:
-        return {
-            "title": m_title.group(1) if m_title else None,
-            "artist": m_artist.group(1) if m_artist else None,
-            "album": m_album.group(1) if m_album else None,
-            "channel": (m_channel.group(1) if m_channel else (m_title.group(1) if m_title else None)),
-        }
-    # XML fallback
+    # Unescape the whole string only when the markup itself is escaped
+    # (nested/double-encoded DIDL payloads announce themselves with "&lt;").
+    # Otherwise work on the raw string and unescape just the captured values
+    # that contain an entity - skipping a full-length scan and copy per call.
+    if "&lt;" in didl:
+        didl = html.unescape(didl)
+    didl = didl.strip()
+    out = {"title": None, "artist": None, "album": None, "channel": None}
+    # Cheap substring precheck: Songcast "short metadata" frequently carries
+    # no element content at all, so skip the regex (and XML fallback) when
+    # none of the wanted tags can possibly be present
+    if "<dc:title" not in didl and "<upnp:" not in didl:
+        return out
+    # Regex fast path: one finditer pass over the string
+    matched = False
+    for m in _RE_DIDL.finditer(didl):
+        val = m.group(2)
+        if "&" in val:
+            val = html.unescape(val)
+        out[_DIDL_KEY_MAP[m.group(1)]] = val
+        matched = True
+    if matched:
+        if out["channel"] is None:
+            out["channel"] = out["title"]
+        return out
+    # XML fallback, only attempted when the fast path matched nothing and
+    # the payload actually contains an item element - paying the parser
+    # cost on junk or empty-container input buys nothing
+    if "<item" not in didl:
+        return out
+    import io
+    import xml.etree.ElementTree as ET  # deferred: fallback is rarely taken
+    # Stream with iterparse and stop once all four fields are captured
+    # instead of building the full tree and running four .// searches
+    needed = len(_DIDL_XML_TAGS)
     try:
-        root = ET.fromstring(didl)
+        for _, el in ET.iterparse(io.StringIO(didl), events=("end",)):
+            key = _DIDL_XML_TAGS.get(el.tag)
+            if key is not None and out[key] is None:
+                out[key] = el.text
+                needed -= 1
+                if needed == 0:
+                    break
     except Exception:
-        return {"title": None, "artist": None, "album": None, "channel": None}
-    ns = {
-        "dc": "http://purl.org/dc/elements/1.1/",
-        "upnp": "urn:schemas-upnp-org:metadata-1-0/upnp/",
-    }
-    title_el = root.find(".//dc:title", ns)
-    artist_el = root.find(".//upnp:artist", ns)
-    album_el = root.find(".//upnp:album", ns)
-    channel_el = root.find(".//upnp:channelName", ns)
-    return {
-        "title": title_el.text if title_el is not None else None,
-        "artist": artist_el.text if artist_el is not None else None,
-        "album": album_el.text if album_el is not None else None,
-        "channel": channel_el.text if channel_el is not None else None,
-    }
+        pass
+    return out
+
+
+async def _product_info(dev) -> Optional[Dict]:
+    """Fetch the combined Product.Product action result (Room/Name/...).
+
+    Linn devices return Room, Name and Model in one SOAP round-trip here,
+    where the attribute-by-attribute path costs a call each. Returns None
+    when the service or action is unavailable so callers fall back.
+    """
+    try:
+        svc = dev.device.service_id("urn:av-openhome-org:serviceId:Product")
+        if svc is None:
+            return None
+        info = await svc.action("Product").async_call()
+    except Exception:
+        return None
+    return info or None
+
 
+async def _resolve_name(ip: str, udn: str) -> Optional[str]:
+    """Resolve a device's display name, short-circuiting on NAME_CACHE.
 
-async def query_device(ip: str, udn: str, name: Optional[str] = None, debug: bool = False, trace_songcast: bool = False) -> Dict[str, Optional[str]]:
+    Single implementation of the name-resolution ladder, shared by the
+    main query and the Songcast sender lookup so a sender that is also in
+    DEVICES is never resolved twice. Tries the combined Product.Product
+    action first (one round-trip), then friendly_name, then Product name.
+
+    Reads NAME_CACHE but never writes it: callers accumulate resolutions
+    locally and merge them once per batch, so concurrent tasks don't
+    mutate the shared dict mid-flight.
+    """
+    cached = NAME_CACHE.get(udn)
+    if cached:
+        return cached
+    dev = await _get_device(ip, udn)
+    resolved_name = None
+    info = await _product_info(dev)
+    if info:
+        resolved_name = info.get("Name") or info.get("Room")
+    if not resolved_name:
+        try:
+            resolved_name = dev.friendly_name()
+        except Exception:
+            resolved_name = None
+    if not resolved_name:
+        try:
+            resolved_name = await dev.name()
+        except Exception:
+            resolved_name = None
+    return resolved_name
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_didl_cached(meta: str) -> Dict:
+    """didl_lite.parse memoized by metadata string.
+
+    A Songcast sender typically broadcasts an identical Metadata blob for
+    long stretches, so repeated runs/polls skip the XML parse entirely.
+    """
+    return didl_lite.parse(meta)
+
+
+async def query_device(ip: str, udn: str, name: Optional[str] = None, debug: bool = False, trace_songcast: bool = False):
     """Query a single device for current status and now-playing info.
 
-    - Resolves the device's display name (friendly_name or Product.Name) and caches it by UDN.
+    - Resolves the device's display name (friendly_name or Product.Name).
     - Reads current Product source and Info track metadata.
     - Derives radio station from Info.title when on Radio.
     - If the source looks like Songcast, queries Receiver.Sender() to infer the sender name
@@ -208,53 +522,83 @@ async def query_device(ip: str, udn: str, name: Optional[str] = None, debug: boo
         trace_songcast: When True, prints Sender Uri and Metadata head for diagnostics
 
     Returns:
-        Dict of fields consumed by format_result().
+        Tuple of (result dict consumed by format_result(), resolved-names
+        dict of UDN -> name). Name resolutions accumulate locally and the
+        caller merges them into NAME_CACHE once per batch, so concurrent
+        tasks never write the shared dict mid-flight.
     """
+    _import_openhome()
     if Device is None:
         raise RuntimeError("openhomedevice not available; please install it.")
-    location = f"http://{ip}:55178/{udn}/Upnp/device.xml"
-    dev = Device(location)
-    await dev.init()
+    resolved: Dict[str, str] = {}
 
-    # Resolve device display name if not provided
-    device_name = name
+    # Fast offline probe: a half-second TCP connect to the OpenHome port
+    # weeds out powered-off/unplugged devices in milliseconds instead of
+    # stacking multi-second init/SOAP timeouts.
     try:
-        fn = dev.friendly_name()
-        if fn:
-            device_name = fn
-    except Exception:
-        pass
-    if not device_name:
-        try:
-            device_name = await dev.name()
-        except Exception:
-            device_name = name or ip
-    # Cache resolved name for later sender lookup
-    try:
-        if device_name:
-            NAME_CACHE[udn] = device_name
-    except Exception:
-        pass
+        _, probe_writer = await asyncio.wait_for(
+            asyncio.open_connection(ip, 55178), timeout=0.5)
+        probe_writer.close()
+    except (asyncio.TimeoutError, OSError):
+        return {
+            "device": NAME_CACHE.get(udn, ip),
+            "source_name": None,
+            "source_type": None,
+            "title": None,
+            "artist": None,
+            "album": None,
+            "station": None,
+            "is_songcast": False,
+            "is_songcast_grouped": False,
+            "songcast_transport_state": None,
+            "songcast_sender": None,
+            "songcast_sender_uri": None,
+            "songcast_sender_meta_head": None,
+            "songcast_status": None,
+            "songcast_sender_scheme": None,
+            "standby": None,
+            "offline": True,
+        }, resolved
+
+    dev = await _get_device(ip, udn)
+
+    # Resolve device display name (resolved name wins over a passed-in one,
+    # matching the old friendly_name-override behavior)
+    resolved_name = await _resolve_name(ip, udn)
+    device_name = resolved_name or name or ip
+    # Record only genuine resolutions for later sender lookup (merged by
+    # the caller) - the ip fallback isn't a name and must not be cached
+    if resolved_name:
+        resolved[udn] = resolved_name
 
     # Source info
-    src = await dev.source()
-    src_name = src.get("name") or src.get("Name")
-    src_type = src.get("type") or src.get("Type")
-    # Standby state
-    try:
-        standby = await dev.is_in_standby()
-    except Exception:
+    # Source, standby and track info are independent SOAP calls - overlap
+    # them so this phase costs one round-trip instead of three
+    src, standby, track = await asyncio.gather(
+        dev.source(), dev.is_in_standby(), dev.track_info(),
+        return_exceptions=True,
+    )
+    if isinstance(src, BaseException):
+        raise src
+    if isinstance(track, BaseException):
+        raise track
+    if isinstance(standby, BaseException):
+        # Standby was always best-effort; keep the None fallback
         standby = None
 
-    # Track via Info service
-    track = await dev.track_info()
+    src_name = src.get("name") or src.get("Name")
+    src_type = src.get("type") or src.get("Type")
+    # Lowercase once; the source checks below reuse these instead of
+    # allocating fresh lowercased temporaries per comparison
+    src_name_l = (src_name or "").lower()
+    src_type_l = (src_type or "").lower()
     title = track.get("title")
     artist = track.get("artist")
     album = track.get("albumTitle")
 
     # For radio, title typically is the station name
     station = None
-    if (src_type or "").lower() == "radio" or (src_name or "").lower() == "radio":
+    if src_type_l == "radio" or src_name_l == "radio":
         station = title
 
     # Songcast sender (Receiver service -> Sender()) only when on Songcast source
@@ -263,7 +607,7 @@ async def query_device(ip: str, udn: str, name: Optional[str] = None, debug: boo
     sender_meta_head_dbg = None
     # Detect when the selected source is Songcast, and separately determine if the
     # device is actually grouped (actively receiving from a Sender).
-    is_songcast_source = ("songcast" in (src_type or "").lower()) or ("songcast" in (src_name or "").lower())
+    is_songcast_source = ("songcast" in src_type_l) or ("songcast" in src_name_l)
     is_songcast_grouped = False
     songcast_transport_state = None
     songcast_status = None
@@ -272,56 +616,58 @@ async def query_device(ip: str, udn: str, name: Optional[str] = None, debug: boo
         try:
             recv = dev.device.service_id("urn:av-openhome-org:serviceId:Receiver")
             if recv is not None:
-                async def _get_sender():
-                    return await recv.action("Sender").async_call()
-                async def _get_transport_state():
-                    return await recv.action("TransportState").async_call()
-                async def _get_status():
-                    return await recv.action("Status").async_call()
                 try:
-                    # Query transport state first to infer active receiver status
-                    try:
-                        ts_res = await asyncio.wait_for(_get_transport_state(), timeout=2.0)
-                        if isinstance(ts_res, dict):
-                            songcast_transport_state = (
-                                ts_res.get("TransportState")
-                                or ts_res.get("transportState")
-                                or ts_res.get("state")
-                            )
-                    except Exception:
-                        songcast_transport_state = None
-                    # Query status for additional context (not used for grouping decision)
-                    try:
-                        st_res = await asyncio.wait_for(_get_status(), timeout=2.0)
-                        if isinstance(st_res, dict):
-                            songcast_status = (
-                                st_res.get("Status")
-                                or st_res.get("status")
-                            )
-                    except Exception:
-                        songcast_status = None
-
-                    sender_res = await asyncio.wait_for(_get_sender(), timeout=2.0)
+                    # The three Receiver actions are independent, so issue
+                    # them concurrently: worst case drops from 6s of stacked
+                    # timeouts to 2s for the whole batch.
+                    ts_res, st_res, sender_res = await asyncio.gather(
+                        _timed_call(udn, recv.action("TransportState").async_call()),
+                        _timed_call(udn, recv.action("Status").async_call()),
+                        _timed_call(udn, recv.action("Sender").async_call()),
+                        return_exceptions=True,
+                    )
+                    if isinstance(ts_res, dict):
+                        songcast_transport_state = (
+                            ts_res.get("TransportState")
+                            or ts_res.get("transportState")
+                            or ts_res.get("state")
+                        )
+                    if isinstance(st_res, dict):
+                        songcast_status = (
+                            st_res.get("Status")
+                            or st_res.get("status")
+                        )
+                    if isinstance(sender_res, BaseException):
+                        raise sender_res
+                    # Destructure Uri/Metadata once; everything below reuses
+                    # the locals instead of re-running the paired dict lookups
+                    if isinstance(sender_res, dict):
+                        uri_val = sender_res.get("Uri") or sender_res.get("uri")
+                        meta_val = sender_res.get("Metadata") or sender_res.get("metadata")
+                    else:
+                        uri_val = meta_val = None
                     if trace_songcast and isinstance(sender_res, dict):
-                        uri_dbg = sender_res.get("Uri") or sender_res.get("uri") or ""
-                        meta_dbg = sender_res.get("Metadata") or sender_res.get("metadata") or ""
+                        uri_dbg = uri_val or ""
+                        meta_dbg = meta_val or ""
                         try:
                             print(f"[TRACE] {device_name}: Receiver.Sender Uri: {uri_dbg}")
                         except Exception:
                             pass
-                        try:
-                            head = html.unescape(meta_dbg)[:400]
-                            print(f"[TRACE] {device_name}: Receiver.Sender Metadata head: {head}")
-                        except Exception:
-                            pass
+                        # Only unescape/slice metadata when there is any - the
+                        # common grouped case carries an empty Metadata field
+                        if meta_dbg:
+                            try:
+                                head = html.unescape(meta_dbg)[:400]
+                                print(f"[TRACE] {device_name}: Receiver.Sender Metadata head: {head}")
+                                sender_meta_head_dbg = head or None
+                            except Exception:
+                                pass
                         # also keep in-result for formatted fallback
                         sender_uri_dbg = uri_dbg or None
-                        sender_meta_head_dbg = head or None
                     if isinstance(sender_res, dict):
                         # Consider grouped if TransportState indicates active playback and Uri is present
-                        uri_val = sender_res.get("Uri") or sender_res.get("uri")
                         uri_present = bool(uri_val)
-                        ts = (songcast_transport_state or "").lower()
+                        ts_l = (songcast_transport_state or "").lower()
                         # Heuristic:
                         # - ohz:// indicates active Songcast zone distribution -> grouped
                         # - ohSongcast:// is a sender descriptor; only grouped when transport active
@@ -333,57 +679,50 @@ async def query_device(ip: str, udn: str, name: Optional[str] = None, debug: boo
                             scheme = None
                         is_songcast_grouped = (
                             (scheme == "ohz") or (
-                                uri_present and scheme == "ohsongcast" and ts in ("playing", "buffering", "connecting")
+                                uri_present and scheme == "ohsongcast" and ts_l in _ACTIVE_TS
                             )
                         )
                         songcast_sender_scheme = scheme
                         # Prefer extracting from Sender Uri query params (room/name)
-                        uri = sender_res.get("Uri") or sender_res.get("uri")
-                        if uri:
+                        if uri_val:
                             try:
-                                u = urlparse(uri)
-                                qs = {k.lower(): v for k, v in parse_qs(u.query).items()}
-                                sender_udn = u.path.strip("/") if u and u.path else None
-                                # common keys seen: room, name
-                                for key in ("room", "name"):
-                                    if key in qs and qs[key]:
-                                        sender = qs[key][0]
-                                        break
+                                um = _SENDER_URI_RE.match(uri_val)
+                                sender_udn = um.group(1).strip("/") if um else None
+                                sender_udn = sender_udn or None
+                                # common keys seen: room, name (room preferred)
+                                query = um.group(2) if um else None
+                                if query:
+                                    room_v = name_v = None
+                                    for km in _SENDER_KV_RE.finditer(query):
+                                        k = km.group(1).lower()
+                                        if k == "room" and room_v is None:
+                                            room_v = km.group(2)
+                                        elif k == "name" and name_v is None:
+                                            name_v = km.group(2)
+                                    val = room_v or name_v
+                                    if val:
+                                        sender = unquote_plus(val)
                                 # If still unknown, try to resolve from sender UDN
                                 if not sender and sender_udn:
                                     # Check cache
                                     sender = NAME_CACHE.get(sender_udn)
                                     if not sender:
                                         # Find matching device IP from known devices
-                                        sender_ip = None
-                                        for dd in DEVICES:
-                                            if dd.get("udn") == sender_udn:
-                                                sender_ip = dd.get("ip")
-                                                break
+                                        sender_ip = _DEV_BY_UDN.get(sender_udn)
                                         if sender_ip:
                                             try:
-                                                ldev = Device(f"http://{sender_ip}:55178/{sender_udn}/Upnp/device.xml")
-                                                await asyncio.wait_for(ldev.init(), timeout=2.0)
-                                                try:
-                                                    lname = ldev.friendly_name()
-                                                except Exception:
-                                                    lname = None
-                                                if not lname:
-                                                    try:
-                                                        lname = await asyncio.wait_for(ldev.name(), timeout=2.0)
-                                                    except Exception:
-                                                        lname = None
+                                                lname = await _timed_call(
+                                                    sender_udn, _resolve_name(sender_ip, sender_udn))
                                                 if lname:
                                                     sender = lname
-                                                    NAME_CACHE[sender_udn] = lname
+                                                    resolved[sender_udn] = lname
                                             except Exception:
                                                 pass
                             except Exception:
                                 pass
                         if not sender:
-                            meta = sender_res.get("Metadata") or sender_res.get("metadata")
-                            if meta:
-                                details = didl_lite.parse(meta) if didl_lite else {}
+                            if meta_val:
+                                details = _parse_didl_cached(meta_val) if didl_lite else {}
                                 sender = details.get("publisher") or details.get("author") or details.get("title") or details.get("artist") or None
                 except Exception:
                     pass
@@ -407,56 +746,71 @@ async def query_device(ip: str, udn: str, name: Optional[str] = None, debug: boo
         "songcast_status": songcast_status,
         "songcast_sender_scheme": songcast_sender_scheme,
         "standby": standby,
-    }
+    }, resolved
 
 
 def format_result(r: Dict[str, Optional[str]]) -> str:
     """Render a concise, single-line summary for a device.
 
     Includes:
+    - "Unreachable" for devices that failed the TCP probe (distinct from
+      standby: the device answered nothing, not "is powered down").
     - Power state (On/Off), with an "(in standby)" note in the device label when Off.
     - Songcast Sender when on Songcast; with optional raw Sender fields if tracing.
     - Station (for Radio), Title/Artist, and Album when available.
     """
-    device = r.get("device") or "Device"
-    src = r.get("source_name") or r.get("source_type") or "Unknown source"
+    # Bind each field once - every r.get() is a hash lookup, and several
+    # fields were read two or three times when this runs in a polling loop
+    get = r.get
+    device = get("device") or "Device"
+    if get("offline"):
+        return f"{device}: Unreachable"
+    src = get("source_name") or get("source_type") or "Unknown source"
+    standby = get("standby")
+    sender_uri = get("songcast_sender_uri")
+    title = get("title")
     parts = []
-    if r.get("standby") is not None:
-        parts.append(f"Power: {'Off' if r['standby'] else 'On'}")
+    if standby is not None:
+        parts.append(f"Power: {'Off' if standby else 'On'}")
     # Add a clear standby note to avoid confusion
-    if r.get("standby"):
+    if standby:
         device = f"{device} (in standby)"
-    if r.get("is_songcast"):
-        scheme = r.get("songcast_sender_scheme") or "unknown"
-        if r.get("is_songcast_grouped"):
-            if r.get("songcast_sender"):
-                parts.append(f"Songcast Sender: {r['songcast_sender']} ({scheme})")
+    if get("is_songcast"):
+        scheme = get("songcast_sender_scheme") or "unknown"
+        if get("is_songcast_grouped"):
+            sender = get("songcast_sender")
+            if sender:
+                parts.append(f"Songcast Sender: {sender} ({scheme})")
             else:
                 parts.append(f"Songcast: Grouped ({scheme}, sender unknown)")
-                if r.get("songcast_sender_uri"):
-                    parts.append(f"Sender Uri: {r['songcast_sender_uri']}")
+                if sender_uri:
+                    parts.append(f"Sender Uri: {sender_uri}")
         else:
             parts.append(f"Songcast: Not grouped ({scheme})")
-            ts = r.get("songcast_transport_state")
-            st = r.get("songcast_status")
+            ts = get("songcast_transport_state")
+            st = get("songcast_status")
             if ts:
                 parts.append(f"Receiver: {ts}")
             if st:
                 parts.append(f"Status: {st}")
             # When tracing, also show raw fields if present
-            if r.get("songcast_sender_uri"):
-                parts.append(f"Sender Uri: {r['songcast_sender_uri']}")
-            if r.get("songcast_sender_meta_head"):
-                parts.append(f"Sender Meta: {r['songcast_sender_meta_head']}")
-    if r.get("station"):
-        parts.append(f"Station: {r['station']}")
-    if r.get("title") and r.get("artist"):
-        parts.append(f"Track: {r['title']} — {r['artist']}")
-    elif r.get("title"):
-        parts.append(f"Title: {r['title']}")
-    if r.get("album"):
-        parts.append(f"Album: {r['album']}")
-    summary = ", ".join(p for p in parts if p)
+            if sender_uri:
+                parts.append(f"Sender Uri: {sender_uri}")
+            meta_head = get("songcast_sender_meta_head")
+            if meta_head:
+                parts.append(f"Sender Meta: {meta_head}")
+    station = get("station")
+    if station:
+        parts.append(f"Station: {station}")
+    artist = get("artist")
+    if title and artist:
+        parts.append(f"Track: {title} — {artist}")
+    elif title:
+        parts.append(f"Title: {title}")
+    album = get("album")
+    if album:
+        parts.append(f"Album: {album}")
+    summary = ", ".join(parts)
     return f"{device} ({src}): {summary if summary else 'No metadata available'}"
 
 
@@ -465,13 +819,82 @@ async def main_async():
     parser = argparse.ArgumentParser(description="Query Linn DSM now playing via openhomedevice")
     parser.add_argument("--debug", action="store_true")
     parser.add_argument("--trace-songcast", action="store_true", help="Trace Songcast Receiver Sender Uri/Metadata")
+    parser.add_argument("--only", metavar="NAME",
+                        help="Only query devices whose name, IP or UDN contains NAME (case-insensitive)")
     args = parser.parse_args()
 
-    for d in DEVICES:
-        r = await query_device(d["ip"], d["udn"], None, debug=args.debug, trace_songcast=args.trace_songcast)
-        print(format_result(r))
+    # Import the heavy stack only once argparse is done (--help exits above)
+    _import_openhome()
+
+    # Query every device concurrently - the workload is pure network wait
+    # (several SOAP roundtrips with up to 2s timeouts each), so total wall
+    # time drops from the sum of device latencies to the max of them.
+    # Results are printed in DEVICES order regardless of completion order.
+    try:
+        # Prefetch names for every known device first: on a cold NAME_CACHE
+        # the Songcast sender branch would otherwise construct a second
+        # Device mid-query for any sender whose own query hasn't completed
+        # yet. _resolve_name is a cache hit for warm entries, so repeat runs
+        # skip this entirely. _resolve_name never writes NAME_CACHE itself,
+        # so merge the batch here before the queries start.
+        prefetch = [d for d in DEVICES if d["udn"] not in NAME_CACHE]
+        names = await asyncio.gather(
+            *(_timed_call(d["udn"], _resolve_name(d["ip"], d["udn"]))
+              for d in prefetch),
+            return_exceptions=True,
+        )
+        NAME_CACHE.update(
+            (d["udn"], n) for d, n in zip(prefetch, names)
+            if isinstance(n, str) and n
+        )
+        # Apply --only after the name prefetch so matching by name works on
+        # a cold cache too. Senders outside the selection still resolve via
+        # the prefetched names above.
+        devices = DEVICES
+        if args.only:
+            needle = args.only.lower()
+            devices = [
+                d for d in DEVICES
+                if needle in d["ip"].lower() or needle in d["udn"].lower()
+                or needle in NAME_CACHE.get(d["udn"], "").lower()
+            ]
+            if not devices:
+                sys.stderr.write(f"No device matches --only {args.only!r}\n")
+                return
+        tasks = [
+            asyncio.create_task(
+                query_device(d["ip"], d["udn"], None, debug=args.debug, trace_songcast=args.trace_songcast)
+            )
+            for d in devices
+        ]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Build all output lines first and write them in one go: a single
+        # syscall/flush instead of one per device, which matters when stdout
+        # is a pipe or slow terminal.
+        lines = []
+        for d, r in zip(devices, results):
+            if isinstance(r, BaseException):
+                lines.append(f"{d['ip']}: query failed: {r}")
+            else:
+                result, resolved = r
+                NAME_CACHE.update(resolved)
+                lines.append(format_result(result))
+        if lines:
+            sys.stdout.write("\n".join(lines) + "\n")
+        # Persist immediately rather than relying solely on atexit (which
+        # never fires if the process is killed)
+        _save_name_cache()
+    finally:
+        await _close_http_session()
 
 def main():
+    # uvloop is a drop-in C event loop that markedly speeds up socket-heavy
+    # asyncio workloads like this one; fall back silently where unavailable
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     return asyncio.run(main_async())
 
 
@@ -24,12 +24,60 @@ Notes:
 - Description output is wrapped for readability.
 """
 
+import io
 import requests
 import json
 import xml.etree.ElementTree as ET
 import sys
 import textwrap
 
+# One pooled session for every SOAP call: HTTP keep-alive reuses the TCP
+# connection to <ip>:55178 across InvokeId/GetIdArray/ReadList instead of
+# paying a fresh handshake per request.
+_SESSION = requests.Session()
+
+# SOAP envelopes built once at import as bytes; the InvokeId and ReadList
+# bodies only vary by the numeric Id / JSON Ids payload, filled via %.
+_BODY_INVOKE_TMPL = b"""<?xml version="1.0" encoding="utf-8"?>
+<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+   <s:Body>
+      <u:InvokeId xmlns:u="urn:av-openhome-org:service:Pins:1">
+         <Id>%d</Id>
+      </u:InvokeId>
+   </s:Body>
+</s:Envelope>"""
+
+_BODY_GET_ID_ARRAY = b"""<?xml version="1.0" encoding="utf-8"?>
+<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+   <s:Body>
+      <u:GetIdArray xmlns:u="urn:av-openhome-org:service:Pins:1" />
+   </s:Body>
+</s:Envelope>"""
+
+_BODY_READ_LIST_TMPL = b"""<?xml version="1.0" encoding="utf-8"?>
+<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+   <s:Body>
+      <u:ReadList xmlns:u="urn:av-openhome-org:service:Pins:1">
+         <Ids>%s</Ids>
+      </u:ReadList>
+   </s:Body>
+</s:Envelope>"""
+
+def _find_first_text(xml_bytes, local):
+    """Return the text of the first element with the given local tag name.
+
+    Streams the response with ET.iterparse and bails out as soon as the
+    wanted element closes, instead of building the whole tree and then
+    scanning it. The Pins responses carry a single large JSON payload in
+    IdArray/List, so stopping early avoids materializing the rest.
+    """
+    suffix = '}' + local
+    for _, el in ET.iterparse(io.BytesIO(xml_bytes), events=('end',)):
+        tag = el.tag
+        if tag == local or tag.endswith(suffix):
+            return el.text
+    return None
+
 def invoke_pin(ip, udn, pin_id):
     """Invoke a specific pin on the Linn device.
 
@@ -38,17 +86,10 @@ def invoke_pin(ip, udn, pin_id):
     """
     url = f'http://{ip}:55178/{udn}/av.openhome.org-Pins-1/control'
     hdrs = {'SOAPACTION': '"urn:av-openhome-org:service:Pins:1#InvokeId"'}
-    msg = f"""<?xml version="1.0" encoding="utf-8"?>
-<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-   <s:Body>
-      <u:InvokeId xmlns:u="urn:av-openhome-org:service:Pins:1">
-         <Id>{pin_id}</Id>
-      </u:InvokeId>
-   </s:Body>
-</s:Envelope>"""
 
     try:
-        resp = requests.post(url, headers=hdrs, data=msg, timeout=10)
+        resp = _SESSION.post(url, headers=hdrs,
+                             data=_BODY_INVOKE_TMPL % pin_id, timeout=10)
         if resp.status_code == 200:
             print(f"✓ Pin {pin_id} invoked successfully")
             return True
@@ -77,23 +118,12 @@ def get_pin_info(ip, udn, pin_index):
     # Step 1: GetIdArray
     try:
         hdrs = {'SOAPACTION': '"urn:av-openhome-org:service:Pins:1#GetIdArray"'}
-        msg = """<?xml version="1.0" encoding="utf-8"?>
-<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-   <s:Body>
-      <u:GetIdArray xmlns:u="urn:av-openhome-org:service:Pins:1" />
-   </s:Body>
-</s:Envelope>"""
-        resp = requests.post(base_url, headers=hdrs, data=msg, timeout=5)
+        resp = _SESSION.post(base_url, headers=hdrs, data=_BODY_GET_ID_ARRAY, timeout=5)
         if resp.status_code != 200:
             print(f"Error getting pin ID array: HTTP {resp.status_code}")
             print(f"Response: {resp.text}")
             return None
-        root = ET.fromstring(resp.text)
-        id_array_json = None
-        for elem in root.iter():
-            if elem.tag.endswith('IdArray'):
-                id_array_json = elem.text
-                break
+        id_array_json = _find_first_text(resp.content, 'IdArray')
         if not id_array_json:
             print("Could not parse IdArray from response")
             return None
@@ -115,26 +145,14 @@ def get_pin_info(ip, udn, pin_index):
     # Step 2: ReadList for the selected pin ID
     try:
         hdrs = {'SOAPACTION': '"urn:av-openhome-org:service:Pins:1#ReadList"'}
-        ids_payload = json.dumps([pin_id])
-        msg = f"""<?xml version=\"1.0\" encoding=\"utf-8\"?>
-<s:Envelope s:encodingStyle=\"http://schemas.xmlsoap.org/soap/encoding/\" xmlns:s=\"http://schemas.xmlsoap.org/soap/envelope/\">
-   <s:Body>
-      <u:ReadList xmlns:u=\"urn:av-openhome-org:service:Pins:1\">
-         <Ids>{ids_payload}</Ids>
-      </u:ReadList>
-   </s:Body>
-</s:Envelope>"""
-        resp = requests.post(base_url, headers=hdrs, data=msg, timeout=5)
+        ids_payload = json.dumps([pin_id]).encode('utf-8')
+        resp = _SESSION.post(base_url, headers=hdrs,
+                             data=_BODY_READ_LIST_TMPL % ids_payload, timeout=5)
         if resp.status_code != 200:
             print(f"Error reading pin metadata: HTTP {resp.status_code}")
             print(f"Response: {resp.text}")
             return None
-        root = ET.fromstring(resp.text)
-        list_json = None
-        for elem in root.iter():
-            if elem.tag.endswith('List'):
-                list_json = elem.text
-                break
+        list_json = _find_first_text(resp.content, 'List')
         if not list_json:
             print("Could not parse List from response")
             return None
@@ -29,6 +29,42 @@ Notes:
 import requests
 import xml.etree.ElementTree as ET
 import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# One pooled session for every SOAP call: HTTP keep-alive reuses the TCP
+# connection to <ip>:55178 across the SourceCount/SourceIndex/Source
+# queries instead of paying a fresh handshake per request.
+_SESSION = requests.Session()
+
+# Visible flag value domain; anything unexpected/missing defaults to visible
+_VIS_MAP = {'true': True, '1': True, 'yes': True,
+            'false': False, '0': False, 'no': False}
+
+# SOAP envelopes built once at import as bytes: the bodies are static apart
+# from the Source index, so there is no need to re-render (and re-encode)
+# the XML on every call. The Source template takes the index via %d.
+_BODY_SOURCE_COUNT = b"""<?xml version="1.0" encoding="utf-8"?>
+<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+   <s:Body>
+      <u:SourceCount xmlns:u="urn:av-openhome-org:service:Product:4" />
+   </s:Body>
+</s:Envelope>"""
+
+_BODY_SOURCE_INDEX = b"""<?xml version="1.0" encoding="utf-8"?>
+<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+   <s:Body>
+      <u:SourceIndex xmlns:u="urn:av-openhome-org:service:Product:4" />
+   </s:Body>
+</s:Envelope>"""
+
+_BODY_SOURCE_TMPL = b"""<?xml version="1.0" encoding="utf-8"?>
+<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+   <s:Body>
+      <u:Source xmlns:u="urn:av-openhome-org:service:Product:4">
+         <Index>%d</Index>
+      </u:Source>
+   </s:Body>
+</s:Envelope>"""
 
 def get_source_count(ip, udn):
     """Get the total number of sources available on the device.
@@ -38,20 +74,14 @@ def get_source_count(ip, udn):
     """
     url = f'http://{ip}:55178/{udn}/av.openhome.org-Product-4/control'
     hdrs = {'SOAPACTION': '"urn:av-openhome-org:service:Product:4#SourceCount"'}
-    msg = """<?xml version="1.0" encoding="utf-8"?>
-<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-   <s:Body>
-      <u:SourceCount xmlns:u="urn:av-openhome-org:service:Product:4" />
-   </s:Body>
-</s:Envelope>"""
 
     try:
-        resp = requests.post(url, headers=hdrs, data=msg, timeout=5)
+        resp = _SESSION.post(url, headers=hdrs, data=_BODY_SOURCE_COUNT, timeout=5)
         if resp.status_code == 200:
-            root = ET.fromstring(resp.text)
-            for elem in root.iter():
-                if elem.tag.endswith('Value'):
-                    return int(elem.text)
+            root = ET.fromstring(resp.content)
+            value = root.findtext('.//{*}Value')
+            if value is not None:
+                return int(value)
         else:
             print(f"Error getting source count: HTTP {resp.status_code}")
             print(f"Response: {resp.text}")
@@ -70,39 +100,28 @@ def get_source_details(ip, udn, source_index):
     """
     url = f'http://{ip}:55178/{udn}/av.openhome.org-Product-4/control'
     hdrs = {'SOAPACTION': '"urn:av-openhome-org:service:Product:4#Source"'}
-    msg = f"""<?xml version="1.0" encoding="utf-8"?>
-<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-   <s:Body>
-      <u:Source xmlns:u="urn:av-openhome-org:service:Product:4">
-         <Index>{source_index}</Index>
-      </u:Source>
-   </s:Body>
-</s:Envelope>"""
 
     try:
-        resp = requests.post(url, headers=hdrs, data=msg, timeout=5)
+        resp = _SESSION.post(url, headers=hdrs,
+                             data=_BODY_SOURCE_TMPL % source_index, timeout=5)
         if resp.status_code == 200:
-            root = ET.fromstring(resp.text)
+            root = ET.fromstring(resp.content)
             source_info = {'name': 'Unknown', 'type': 'Unknown', 'visible': True}
-            
-            for elem in root.iter():
-                # Prefer 'Name'; fall back to 'SystemName'
-                if elem.tag.endswith('Name'):
-                    source_info['name'] = elem.text or f'Source {source_index}'
-                elif elem.tag.endswith('SystemName'):
-                    source_info['name'] = elem.text or f'Source {source_index}'
-                elif elem.tag.endswith('Type'):
-                    source_info['type'] = elem.text or 'Unknown'
-                elif elem.tag.endswith('Visible'):
-                    txt = (elem.text or '').strip().lower()
-                    if txt in ('true', '1', 'yes'):
-                        source_info['visible'] = True
-                    elif txt in ('false', '0', 'no'):
-                        source_info['visible'] = False
-                    else:
-                        # Default to visible if value is unexpected/missing
-                        source_info['visible'] = True
-            
+
+            # Direct field lookups on the response element instead of a
+            # whole-tree scan with per-element tag checks
+            resp_el = root.find('.//{*}SourceResponse')
+            if resp_el is None:
+                resp_el = root
+
+            # Prefer 'Name'; fall back to 'SystemName'
+            name = resp_el.findtext('.//{*}Name') or resp_el.findtext('.//{*}SystemName')
+            source_info['name'] = name or f'Source {source_index}'
+            source_info['type'] = resp_el.findtext('.//{*}Type') or 'Unknown'
+
+            txt = (resp_el.findtext('.//{*}Visible') or '').strip().lower()
+            source_info['visible'] = _VIS_MAP.get(txt, True)
+
             return source_info
         else:
             print(f"Error getting source {source_index}: HTTP {resp.status_code}")
@@ -118,20 +137,14 @@ def get_current_source(ip, udn):
     """
     url = f'http://{ip}:55178/{udn}/av.openhome.org-Product-4/control'
     hdrs = {'SOAPACTION': '"urn:av-openhome-org:service:Product:4#SourceIndex"'}
-    msg = """<?xml version="1.0" encoding="utf-8"?>
-<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-   <s:Body>
-      <u:SourceIndex xmlns:u="urn:av-openhome-org:service:Product:4" />
-   </s:Body>
-</s:Envelope>"""
 
     try:
-        resp = requests.post(url, headers=hdrs, data=msg, timeout=5)
+        resp = _SESSION.post(url, headers=hdrs, data=_BODY_SOURCE_INDEX, timeout=5)
         if resp.status_code == 200:
-            root = ET.fromstring(resp.text)
-            for elem in root.iter():
-                if elem.tag.endswith('Value'):
-                    return int(elem.text)
+            root = ET.fromstring(resp.content)
+            value = root.findtext('.//{*}Value')
+            if value is not None:
+                return int(value)
         return -1
     except Exception as e:
         print(f"Error getting current source: {e}")
@@ -174,9 +187,13 @@ def main():
     print("\nAvailable Sources:")
     print("-" * 40)
     
-    # Query each source
-    for i in range(source_count):
-        source_info = get_source_details(ip, udn, i)
+    # Query all sources concurrently: each detail fetch is an independent
+    # SOAP round-trip, so enumeration costs ~1 RTT instead of N. The session
+    # pool reuses connections across workers and map() preserves index order.
+    with ThreadPoolExecutor(max_workers=min(8, source_count or 1)) as pool:
+        details = list(pool.map(lambda i: get_source_details(ip, udn, i), range(source_count)))
+
+    for i, source_info in enumerate(details):
         current_marker = " <- CURRENT" if i == current_source else ""
         visible_marker = "" if source_info['visible'] else " (HIDDEN)"
         
@@ -35,12 +35,17 @@ Notes:
 - Recommended: pipe terminal output to a file for reliable reading.
 """
 
+import functools
+import json
+import re
 import sys
 import argparse
 import asyncio
+import time
 import xml.etree.ElementTree as ET
 import requests
 import os
+from urllib.parse import urlencode
 try:
     # Ensure immediate flushing of prints when redirected
     sys.stdout.reconfigure(line_buffering=True)
@@ -49,7 +54,7 @@ except Exception:
 
 # Import LPEC utilities for state verification
 try:
-    from lpec_utils import wait_for_state, format_state_summary
+    from lpec_utils import wait_for_state, format_state_summary, await_receiver_state
     LPEC_AVAILABLE = True
 except ImportError:
     LPEC_AVAILABLE = False
@@ -59,36 +64,102 @@ try:
 except Exception:
     Device = None
 
+try:
+    import aiohttp
+except Exception:
+    aiohttp = None
+
+from xml.sax.saxutils import escape as _xml_escape
+
+# Raw-SOAP constants for the Receiver join path: the Play envelope is fully
+# static and SetSender only varies by Uri, so build them once at import
+# instead of re-rendering f-strings inside the candidate retry loop.
+_HDRS_SET_SENDER = {
+    "SOAPACTION": '"urn:av-openhome-org:service:Receiver:1#SetSender"',
+    "Content-Type": 'text/xml; charset="utf-8"',
+}
+_HDRS_PLAY = {
+    "SOAPACTION": '"urn:av-openhome-org:service:Receiver:1#Play"',
+    "Content-Type": 'text/xml; charset="utf-8"',
+}
+_SET_SENDER_TMPL = """<?xml version="1.0" encoding="utf-8"?>
+<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+    <s:Body>
+        <u:SetSender xmlns:u="urn:av-openhome-org:service:Receiver:1">
+            <Uri>{uri}</Uri>
+            <Metadata></Metadata>
+        </u:SetSender>
+    </s:Body>
+</s:Envelope>"""
+_PLAY_ENVELOPE = b"""<?xml version="1.0" encoding="utf-8"?>
+<s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
+    <s:Body>
+        <u:Play xmlns:u="urn:av-openhome-org:service:Receiver:1"></u:Play>
+    </s:Body>
+</s:Envelope>"""
+
+# Source-classification bitfield, computed once when the source table is
+# cached so the hot paths test a single integer instead of re-running
+# lower() + substring scans per source per call
+_SRC_RECV = 1  # Songcast receiver-capable (joinable)
+_SRC_SEND = 2  # Songcast sender-capable
+
+def _classify_source(type_l, name_l):
+    flags = 0
+    if 'songcast' in name_l or 'receiver' in type_l or 'songcast' in type_l:
+        flags |= _SRC_RECV
+    if 'sender' in type_l or ('songcast' in name_l and 'sender' in name_l):
+        flags |= _SRC_SEND
+    return flags
+
+# KEY=value lines; the value stops at a '#' so inline comments are dropped,
+# and full-comment/blank lines simply never match
+_ENV_LINE_RE = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*([^\n#]*)', re.M)
+
 def _load_env_devices(env_path):
     devices = {}
     sender_id = None
     receiver_ids = []
     try:
         with open(env_path, 'r') as f:
-            for raw in f:
-                line = raw.strip()
-                if not line or line.startswith('#'):
-                    continue
-                # strip inline comment
-                if '#' in line:
-                    line = line.split('#', 1)[0].strip()
-                if not line or '=' not in line:
-                    continue
-                key, val = line.split('=', 1)
-                key = key.strip()
-                val = val.strip()
-                if key.startswith('DEVICE'):
-                    parts = val.split()
-                    if len(parts) >= 2:
-                        devices[key] = {"ip": parts[0], "udn": parts[1]}
-                elif key == 'SONGCAST_SENDER':
-                    sender_id = val.strip()
-                elif key == 'SONGCAST_RECEIVERS':
-                    receiver_ids = [v.strip() for v in val.split(',') if v.strip()]
+            data = f.read()
+        # One compiled-regex pass over the file instead of per-line
+        # strip/startswith/split tokenisation
+        for m in _ENV_LINE_RE.finditer(data):
+            key = m.group(1)
+            val = m.group(2).strip()
+            if key.startswith('DEVICE'):
+                parts = val.split()
+                if len(parts) >= 2:
+                    devices[key] = {"ip": parts[0], "udn": parts[1]}
+            elif key == 'SONGCAST_SENDER':
+                sender_id = val
+            elif key == 'SONGCAST_RECEIVERS':
+                receiver_ids = [v.strip() for v in val.split(',') if v.strip()]
     except Exception:
         pass
     return devices, sender_id, receiver_ids
 
+# Initialised Device objects keyed by (ip, udn); see _init_dev
+_DESC_CACHE = {}
+
+# Songcast source index per UDN, persisted across runs: a device's source
+# table is fixed by configuration, so steady-state re-runs can skip the
+# whole Source enumeration. See set_source_to_songcast.
+_IDX_CACHE_PATH = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"),
+    "openhome-songcast-idx.json")
+
+@functools.lru_cache(maxsize=8)
+def _parse_senders(raw):
+    """Parse a SenderList document, memoised on the raw string.
+
+    Receivers frequently return byte-identical XML across discovery
+    retries; caching on the string turns the repeat parses into a dict
+    lookup instead of a fresh DOM build.
+    """
+    return ET.fromstring(raw)
+
 class LinnSongcastGrouper:
         def __init__(self, sender_ip, sender_udn, receivers, debug=False):
             self.sender_ip = sender_ip
@@ -97,6 +168,36 @@ class LinnSongcastGrouper:
             self.sender_name = None
             self.receivers = receivers or []
             self.debug = debug
+            # Lazily created shared aiohttp session for raw SOAP posts
+            self._http = None
+            # Pooled session for the synchronous fallback path in _post, so
+            # even without aiohttp the SOAP posts reuse keep-alive sockets
+            # instead of opening a TCP connection per call
+            self._session = requests.Session()
+            self._session.mount("http://", requests.adapters.HTTPAdapter(
+                pool_connections=16, pool_maxsize=32))
+            # Hosts whose SOAP connect recently failed, mapped to the
+            # monotonic time the entry expires; _post skips them instead of
+            # re-timing-out per candidate, then retries once the TTL lapses
+            self._conn_failed = {}
+            # Songcast source indices remembered from previous runs
+            self._idx_cache = {}
+            try:
+                with open(_IDX_CACHE_PATH, 'r') as f:
+                    self._idx_cache = {u: int(i) for u, i in json.load(f).items()}
+            except Exception:
+                pass
+
+        def _save_idx_cache(self):
+            """Persist the Songcast-index cache; best-effort, atomic replace."""
+            try:
+                os.makedirs(os.path.dirname(_IDX_CACHE_PATH), exist_ok=True)
+                tmp = _IDX_CACHE_PATH + ".tmp"
+                with open(tmp, 'w') as f:
+                    json.dump(self._idx_cache, f)
+                os.replace(tmp, _IDX_CACHE_PATH)
+            except Exception:
+                pass
 
         def _location(self, ip, udn):
             return f"http://{ip}:55178/{udn}/Upnp/device.xml"
@@ -104,26 +205,142 @@ class LinnSongcastGrouper:
         async def _init_dev(self, ip, udn):
             if Device is None:
                 raise RuntimeError("openhomedevice not available; install in .venv")
+            # Process-level cache: when the grouper is driven as a library
+            # (or the same device appears as sender and receiver), the
+            # description fetch + parse and the room/name lookups run once
+            # per device per process instead of per call.
+            key = (ip, udn)
+            dev = _DESC_CACHE.get(key)
+            if dev is not None:
+                return dev
             dev = Device(self._location(ip, udn))
             await dev.init()
+            # Resolve room/name once, concurrently, at init time: openhomedevice
+            # issues a fresh Product action per call, and these values are
+            # re-read during name resolution and every receiver join.
+            room, name = await asyncio.gather(
+                dev.room(), dev.name(), return_exceptions=True)
+            dev._cached_room = None if isinstance(room, BaseException) else room
+            dev._cached_name = None if isinstance(name, BaseException) else name
+            _DESC_CACHE[key] = dev
             return dev
 
+        async def _post(self, url, headers, data):
+            """Issue a SOAP POST without blocking the event loop.
+
+            A synchronous requests.post here stalls every other receiver's
+            coroutine for up to its timeout. Prefer an awaited aiohttp call
+            through a shared lazy session; fall back to requests in a worker
+            thread when aiohttp is unavailable.
+
+            Timeouts are split connect/read (0.5s/2.5s): on a LAN a dead
+            device fails the TCP connect within milliseconds, so the error
+            path no longer burns the full total on every attempt. A host
+            whose connect failed is skipped for the next 30 seconds, then
+            retried - long enough to cover one grouping run, short enough
+            that a rebooting device isn't written off forever.
+            """
+            host = url.split('/', 3)[2]
+            expiry = self._conn_failed.get(host)
+            if expiry is not None:
+                if time.monotonic() < expiry:
+                    raise OSError(f"{host} recently unreachable; skipping SOAP post")
+                del self._conn_failed[host]
+            try:
+                if aiohttp is not None:
+                    if self._http is None or self._http.closed:
+                        # Keep-alive pooling: the connector holds the TCP
+                        # connection to each receiver's control endpoint open,
+                        # so the SetSender/Play/fallback posts to one device
+                        # share a single connection instead of paying
+                        # connect+teardown per request.
+                        self._http = aiohttp.ClientSession(
+                            connector=aiohttp.TCPConnector(
+                                limit_per_host=2, keepalive_timeout=30),
+                            timeout=aiohttp.ClientTimeout(
+                                sock_connect=0.5, sock_read=2.5))
+                    async with self._http.post(url, headers=headers, data=data) as resp:
+                        await resp.read()
+                        return resp.status
+                resp = await asyncio.to_thread(
+                    self._session.post, url, headers=headers, data=data,
+                    timeout=(0.5, 2.5))
+                return resp.status_code
+            except Exception as e:
+                if self._is_connect_failure(e):
+                    self._conn_failed[host] = time.monotonic() + 30.0
+                raise
+
+        @staticmethod
+        def _is_connect_failure(e):
+            """True only when the TCP connection itself could not be made.
+
+            Classified by exception type, not message text: a mid-response
+            ConnectionResetError or ServerDisconnectedError mentions
+            "connect" too, yet proves the host is reachable and must not
+            put it on the skip list.
+            """
+            if aiohttp is not None:
+                connect_errors = (aiohttp.ClientConnectorError,)
+                # aiohttp 3.10+ separates connect timeouts from read timeouts
+                timeout_cls = getattr(aiohttp, "ConnectionTimeoutError", None)
+                if timeout_cls is not None:
+                    connect_errors += (timeout_cls,)
+                if isinstance(e, connect_errors):
+                    return True
+            return isinstance(e, (requests.exceptions.ConnectTimeout,
+                                  ConnectionRefusedError))
+
+        async def _soap_set_sender_play(self, url, uri):
+            """Raw SetSender + Play against a Receiver control URL.
+
+            Single implementation for the candidate loop and the last-resort
+            fallback, using the precompiled envelopes.
+            """
+            msg_set = _SET_SENDER_TMPL.format(
+                uri=_xml_escape(str(uri))).encode('utf-8')
+            # Fire both posts together: Play no longer waits a full RTT for
+            # the SetSender response. Play is idempotent, and if it lands
+            # first the join-confirmation wait simply catches the state once
+            # SetSender has been applied.
+            await asyncio.gather(
+                self._post(url, _HDRS_SET_SENDER, msg_set),
+                self._post(url, _HDRS_PLAY, _PLAY_ENVELOPE),
+            )
+
         async def _resolve_device_name(self, dev, fallback=None):
-            # Try friendly_name (from device.xml), then Product.Name()
+            # Try friendly_name (from device.xml), then the Product name
+            # cached by _init_dev
             try:
                 fn = dev.friendly_name()
                 if fn:
                     return fn
             except Exception:
                 pass
-            try:
-                nm = await dev.name()
-                if nm:
-                    return nm
-            except Exception:
-                pass
+            nm = getattr(dev, "_cached_name", None)
+            if nm:
+                return nm
             return fallback
 
+        async def _await_ready(self, predicate, timeout=1.0, interval=0.1):
+            """Poll an async predicate until it is true or timeout expires.
+
+            Replaces the fixed 1s settling sleeps: a healthy device reports
+            ready within a poll or two, while the old worst case remains the
+            ceiling. Predicate exceptions count as "not ready yet".
+            """
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout
+            while True:
+                try:
+                    if await predicate():
+                        return True
+                except Exception:
+                    pass
+                if loop.time() >= deadline:
+                    return False
+                await asyncio.sleep(interval)
+
         async def wake_device(self, dev, name):
             print(f"Waking {name} from standby...")
             try:
@@ -134,66 +351,145 @@ class LinnSongcastGrouper:
                 print(f"✗ Failed to wake {name}: {e}")
                 return False
 
-        async def _find_songcast_index(self, dev):
+        @staticmethod
+        def _svc(dev, short):
+            """Resolved service handle, cached on the device object.
+
+            service_id() re-walks the parsed device description every call
+            even though the handle never changes for the device's lifetime.
+            """
+            attr = "_svc_" + short.lower()
+            svc = getattr(dev, attr, None)
+            if svc is None:
+                svc = dev.device.service_id(f"urn:av-openhome-org:serviceId:{short}")
+                setattr(dev, attr, svc)
+            return svc
+
+        async def _enumerate_sources(self, dev):
+            """Source table [(index, type, name, visible, flags)], cached on the device.
+
+            Costs SourceCount plus one Source call per index on first touch
+            and nothing afterwards; the table is static for a session, so
+            _find_songcast_index and _get_current_source_info stop re-issuing
+            the same 9+ SOAP round-trips.
+            """
+            cached = getattr(dev, "_sources", None)
+            if cached is not None:
+                return cached
+            sources = []
             try:
-                prod = dev.device.service_id("urn:av-openhome-org:serviceId:Product")
-                if prod is None:
-                    return None
-                sc = await prod.action("SourceCount").async_call()
-                count = int(sc.get("Value") or 8)
-                for i in range(count):
-                    try:
-                        sres = await prod.action("Source").async_call(Index=i)
+                prod = self._svc(dev, "Product")
+                if prod is not None:
+                    sc = await prod.action("SourceCount").async_call()
+                    count = int(sc.get("Value") or 8)
+                    # Fetch all Source entries concurrently: one round-trip of
+                    # latency instead of count sequential ones
+                    replies = await asyncio.gather(
+                        *(prod.action("Source").async_call(Index=i) for i in range(count)),
+                        return_exceptions=True,
+                    )
+                    for i, sres in enumerate(replies):
+                        if isinstance(sres, BaseException):
+                            continue
                         typ = (sres.get("Type") or "").lower()
                         name = (sres.get("Name") or sres.get("SystemName") or "").lower()
                         vis = (sres.get("Visible") or "true").strip().lower()
-                        if vis in ("true", "1", "yes") and ("songcast" in name or "receiver" in typ or "songcast" in typ):
-                            return i
-                    except Exception:
-                        continue
+                        sources.append((i, typ, name, vis in ("true", "1", "yes"),
+                                        _classify_source(typ, name)))
             except Exception:
                 pass
+            dev._sources = sources
+            return sources
+
+        async def _find_songcast_index(self, dev):
+            for i, _typ, _name, visible, flags in await self._enumerate_sources(dev):
+                if visible and flags & _SRC_RECV:
+                    return i
             return None
 
         async def _get_current_source_info(self, dev):
             try:
-                prod = dev.device.service_id("urn:av-openhome-org:serviceId:Product")
+                prod = self._svc(dev, "Product")
                 if prod is None:
                     return None
+                # Only SourceIndex needs a live call - it changes underneath us
                 idx_res = await prod.action("SourceIndex").async_call()
                 cur_idx = int(idx_res.get("Value") or idx_res.get("Index") or -1)
                 if cur_idx < 0:
                     return None
+                for i, typ, name, _vis, flags in await self._enumerate_sources(dev):
+                    if i == cur_idx:
+                        return {"index": cur_idx, "type": typ, "name": name, "flags": flags}
+                # Index not in the cached table; fall back to a live lookup
                 sres = await prod.action("Source").async_call(Index=cur_idx)
+                typ = (sres.get("Type") or "").lower()
+                name = (sres.get("Name") or sres.get("SystemName") or "").lower()
                 return {
                     "index": cur_idx,
-                    "type": (sres.get("Type") or "").lower(),
-                    "name": (sres.get("Name") or sres.get("SystemName") or "").lower(),
+                    "type": typ,
+                    "name": name,
+                    "flags": _classify_source(typ, name),
                 }
             except Exception:
                 return None
 
-        async def set_source_to_songcast(self, dev, name):
+        async def set_source_to_songcast(self, dev, name, udn=None):
             print(f"Setting {name} source to Songcast...")
             try:
-                prod = dev.device.service_id("urn:av-openhome-org:serviceId:Product")
+                prod = self._svc(dev, "Product")
                 if prod is None:
                     raise RuntimeError("Product service not available")
 
                 cur = await self._get_current_source_info(dev)
-                if cur and ("songcast" in cur.get("name", "") or "receiver" in cur.get("type", "") or "songcast" in cur.get("type", "")):
+                if cur and cur["flags"] & _SRC_RECV:
                     print(f"✓ {name} already on Songcast (index {cur['index']})")
                     return True
 
-                idx = await self._find_songcast_index(dev)
-                if idx is None:
-                    print(f"⚠ Songcast source not found on {name}; skipping source change")
-                    return False
+                # A device's Songcast index rarely moves between runs, so the
+                # persisted cache skips the Source enumeration on the happy
+                # path; the post-set verification below catches (and evicts)
+                # a stale entry when the source list has changed.
+                from_cache = udn is not None and udn in self._idx_cache
+                if from_cache:
+                    idx = self._idx_cache[udn]
+                else:
+                    idx = await self._find_songcast_index(dev)
+                    if idx is None:
+                        print(f"⚠ Songcast source not found on {name}; skipping source change")
+                        return False
+                    if udn:
+                        self._idx_cache[udn] = idx
+                        await asyncio.to_thread(self._save_idx_cache)
 
                 try:
                     await prod.action("SetSourceIndex").async_call(aIndex=idx)
                 except Exception:
                     await prod.action("SetSourceIndex").async_call(Value=idx)
+
+                if from_cache:
+                    # Trust but verify: confirm the device actually landed on
+                    # a receiver-capable source. On mismatch the entry is
+                    # stale - evict it, enumerate for the real index and set
+                    # that instead.
+                    async def _applied():
+                        cur = await self._get_current_source_info(dev)
+                        return bool(cur and cur["index"] == idx
+                                    and cur["flags"] & _SRC_RECV)
+                    if not await self._await_ready(_applied):
+                        print(f"⚠ Cached Songcast index {idx} stale on {name}; re-enumerating")
+                        self._idx_cache.pop(udn, None)
+                        idx = await self._find_songcast_index(dev)
+                        if idx is None:
+                            await asyncio.to_thread(self._save_idx_cache)
+                            print(f"⚠ Songcast source not found on {name}; skipping source change")
+                            return False
+                        self._idx_cache[udn] = idx
+                        await asyncio.to_thread(self._save_idx_cache)
+                        try:
+                            await prod.action("SetSourceIndex").async_call(aIndex=idx)
+                        except Exception:
+                            await prod.action("SetSourceIndex").async_call(Value=idx)
+
                 print(f"✓ {name} source set to Songcast (index {idx})")
                 return True
             except Exception as e:
@@ -202,7 +498,6 @@ class LinnSongcastGrouper:
 
 
         def _build_sender_uri(self, sender_udn, sender_name=None, sender_room=None):
-            from urllib.parse import urlencode
             params = {}
             if sender_room:
                 params["room"] = sender_room
@@ -212,114 +507,182 @@ class LinnSongcastGrouper:
             return f"ohSongcast://{sender_udn}{q}"
 
         async def _is_grouped(self, dev):
+            # Short TTL cache: verification paths ask several times in quick
+            # succession, and 300ms staleness is fine for a flag that only
+            # flips on SetSender/Stop.
+            now = asyncio.get_running_loop().time()
+            cached = getattr(dev, "_grouped_cache", None)
+            if cached is not None and cached[0] > now:
+                return cached[1]
+            grouped = False
             try:
-                recv = dev.device.service_id("urn:av-openhome-org:serviceId:Receiver")
+                recv = self._svc(dev, "Receiver")
                 if recv is None:
                     return False
+                uri_val = ""
                 try:
                     sres = await recv.action("Sender").async_call()
                     uri_val = (sres.get("Uri") or sres.get("uri") or "")
-                    from urllib.parse import urlparse
-                    if uri_val and urlparse(uri_val).scheme.lower() == "ohz":
-                        return True
                 except Exception:
-                    pass
+                    uri_val = ""
+                # An ohz/ohu URI settles the question on its own; anything
+                # else - no URI, or an ohSongcast:// descriptor like the one
+                # _build_sender_uri sets - still needs the TransportState
+                # round-trip to tell a live join from a stale SetSender
+                if uri_val and uri_val.lower().startswith(("ohz://", "ohu://")):
+                    grouped = True
+                else:
+                    try:
+                        ts = await recv.action("TransportState").async_call()
+                        state = (ts.get("TransportState") or ts.get("state") or "").lower()
+                        grouped = state in ("playing", "buffering", "connecting")
+                    except Exception:
+                        grouped = False
+            except Exception:
+                grouped = False
+            dev._grouped_cache = (now + 0.3, grouped)
+            return grouped
+
+        async def _discover_ohz(self, recv, sender_room, sender_name):
+            """Find the sender's ohz:// URI via Receiver.Senders.
+
+            Retries with exponential backoff (0.1, 0.2, 0.4, 0.8s) rather
+            than the old flat 0.5s, and is run as a background task so join
+            attempts with the multicast default are not serialised behind it.
+            Returns the URI or None.
+            """
+            for i in range(5):
                 try:
-                    ts = await recv.action("TransportState").async_call()
-                    state = (ts.get("TransportState") or ts.get("state") or "").lower()
-                    return state in ("playing", "buffering", "connecting")
+                    slist = await recv.action("Senders").async_call()
+                    raw_list = slist.get("SenderList") or slist.get("List") or slist.get("senders")
+                    if isinstance(raw_list, str) and raw_list.strip():
+                        # One findall per level with namespace-wildcard paths
+                        # instead of streaming every element and comparing
+                        # tag suffixes: items are direct children of the
+                        # DIDL-Lite root, so this touches only what we need
+                        exact = None; fallbacks = []
+                        for it in _parse_senders(raw_list).findall('{*}item'):
+                            title = (it.findtext('{*}title') or '').strip()
+                            res_uris = [r.text for r in it.findall('{*}res')
+                                        if r.text and r.text.startswith('ohz://')]
+                            if title and res_uris and ((sender_room and title == sender_room) or (sender_name and title == sender_name)):
+                                exact = res_uris[0]
+                                break
+                            fallbacks.extend(res_uris)
+                        ohz_uri = exact or (fallbacks[0] if fallbacks else None)
+                        if ohz_uri:
+                            return ohz_uri
                 except Exception:
-                    return False
-            except Exception:
-                return False
+                    pass
+                if i < 4:
+                    await asyncio.sleep(0.1 * (2 ** i))
+            return None
 
-        async def _receiver_join(self, receiver_dev, sender_dev, receiver_ip, receiver_udn, fallback_sender_udn, fallback_sender_name):
+        async def _resolve_sender_descriptor(self, mdev):
+            """Resolve sender-side join parameters once for the whole group.
+
+            Every receiver joins the same sender, so the sender's room/name,
+            the URI/metadata its Sender service advertises and the multicast
+            default are identical across receivers. Querying them inside
+            _receiver_join cost three UPnP round-trips per receiver; resolve
+            them here after the sender wake and hand the dict down instead.
+            """
+            uri = None
+            metadata = None
+            try:
+                ssvc = self._svc(mdev, "Sender")
+                if ssvc is not None:
+                    sres = await ssvc.action("Sender").async_call()
+                    uri = sres.get("Uri") or sres.get("uri")
+                    metadata = sres.get("Metadata") or sres.get("metadata")
+            except Exception:
+                uri = None
+                metadata = None
+            return {
+                "room": getattr(mdev, "_cached_room", None),
+                "name": getattr(mdev, "_cached_name", None) or self.sender_name,
+                "uri": uri,
+                "metadata": metadata,
+                "default_ohz": f"ohz://239.255.255.250:51972/{self.sender_udn}",
+            }
+
+        async def _receiver_join(self, receiver_dev, sender_desc, receiver_ip, receiver_udn):
             try:
-                recv = receiver_dev.device.service_id("urn:av-openhome-org:serviceId:Receiver")
+                recv = self._svc(receiver_dev, "Receiver")
                 if recv is None:
                     return False
+                # Sender-side values resolved once in _resolve_sender_descriptor
+                sender_room = sender_desc["room"]
+                sender_name = sender_desc["name"]
+                sender_udn = self.sender_udn
+
+                # Re-runs commonly find the receiver already joined; when it
+                # reports grouped and its Sender.Uri points at this sender,
+                # skip the whole Stop/SetSender/Play dance.
                 try:
-                    sender_room = await sender_dev.room()
-                except Exception:
-                    sender_room = None
-                try:
-                    sender_name = await sender_dev.name()
+                    if await self._is_grouped(receiver_dev):
+                        sres0 = await recv.action("Sender").async_call()
+                        uri0 = sres0.get("Uri") or sres0.get("uri") or ""
+                        if sender_udn and sender_udn in uri0:
+                            print(f"✓ Receiver already joined via Uri {uri0}")
+                            return True
                 except Exception:
-                    sender_name = fallback_sender_name
-                sender_udn = fallback_sender_udn
+                    pass
 
                 candidate_uris = []
-                uri = None
-                metadata = None
-                # Prefer sender's Sender info
-                try:
-                    ssvc = sender_dev.device.service_id("urn:av-openhome-org:serviceId:Sender")
-                    if ssvc is not None:
-                        sres = await ssvc.action("Sender").async_call()
-                        uri = sres.get("Uri") or sres.get("uri")
-                        metadata = sres.get("Metadata") or sres.get("metadata")
-                        if uri:
-                            candidate_uris.append(uri)
-                except Exception:
-                    uri = None
-                    metadata = None
+                uri = sender_desc["uri"]
+                metadata = sender_desc["metadata"]
+                if uri:
+                    candidate_uris.append(uri)
                 if not uri:
                     uri = self._build_sender_uri(sender_udn, sender_name=sender_name, sender_room=sender_room)
                 candidate_uris.append(uri)
 
                 if metadata is None:
-                    title = f"{sender_room or ''} - {sender_name or ''}".strip(" -")
+                    # Room/name come straight off the device; escape them so
+                    # an '&' or '<' in either cannot break the DIDL document
+                    title = _xml_escape(f"{sender_room or ''} - {sender_name or ''}".strip(" -"))
                     metadata = (
                         "<?xml version=\"1.0\"?>"
                         "<DIDL-Lite xmlns=\"urn:schemas-upnp-org:metadata-1-0/DIDL-Lite/\" xmlns:dc=\"http://purl.org/dc/elements/1.1/\" xmlns:upnp=\"urn:schemas-upnp-org:metadata-1-0/upnp/\">"
                         "<item id=\"ohSongcast\" parentID=\"0\" restricted=\"true\">"
                         f"<dc:title>{title}</dc:title>"
                         "<upnp:class>object.item.audioItem</upnp:class>"
-                        f"<upnp:artist>{sender_name or ''}</upnp:artist>"
-                        f"<upnp:album>{sender_room or ''}</upnp:album>"
+                        f"<upnp:artist>{_xml_escape(sender_name or '')}</upnp:artist>"
+                        f"<upnp:album>{_xml_escape(sender_room or '')}</upnp:album>"
                         "<dc:publisher>OpenHome</dc:publisher>"
                         "</item>"
                         "</DIDL-Lite>"
                     )
 
-                # Discover ohz via Receiver.Senders (short retries)
-                ohz_uri = None
-                for _ in range(6):
-                    try:
-                        slist = await recv.action("Senders").async_call()
-                        raw_list = slist.get("SenderList") or slist.get("List") or slist.get("senders")
-                        if isinstance(raw_list, str) and raw_list.strip():
-                            root = ET.fromstring(raw_list)
-                            items = [el for el in root.iter() if el.tag.endswith('item')]
-                            exact = None; fallbacks = []
-                            for it in items:
-                                title = None
-                                res_uris = []
-                                for ch in it:
-                                    tag = ch.tag; txt = ch.text or ''
-                                    if tag.endswith('title'):
-                                        title = txt.strip()
-                                    elif tag.endswith('res') and txt.startswith('ohz://'):
-                                        res_uris.append(txt)
-                                if title and res_uris and ((sender_room and title == sender_room) or (sender_name and title == sender_name)):
-                                    exact = res_uris[0]
-                                    break
-                                fallbacks.extend(res_uris)
-                            ohz_uri = exact or (fallbacks[0] if fallbacks else None)
-                        if ohz_uri:
-                            break
-                    except Exception:
-                        pass
-                    await asyncio.sleep(0.5)
-                if ohz_uri:
-                    candidate_uris.insert(0, ohz_uri)
-                elif sender_udn:
-                    candidate_uris.insert(0, f"ohz://239.255.255.250:51972/{sender_udn}")
+                # When the sender's Sender service already advertises an
+                # ohz:// URI there is nothing to discover - it is already the
+                # first candidate. Otherwise discover in the background: join
+                # attempts start immediately with the multicast default and
+                # upgrade to the discovered URI if it arrives between tries.
+                if uri and uri.lower().startswith("ohz://"):
+                    ohz_task = None
+                else:
+                    ohz_task = asyncio.create_task(
+                        self._discover_ohz(recv, sender_room, sender_name))
+                    if sender_udn:
+                        candidate_uris.insert(0, sender_desc["default_ohz"])
                 print(f"Candidates: {candidate_uris}")
 
-                # Try candidates
+                # Try candidates; a late-arriving discovered ohz URI is
+                # promoted to the front of the queue between attempts.
+                # Debug lines are buffered and flushed once after the loop:
+                # stdout is line-buffered here, so each print inside the loop
+                # would take the lock and flush under the event loop.
                 ok = False
-                for cand in candidate_uris:
+                tried = set()
+                dbg = []
+                queue = list(candidate_uris)
+                while queue:
+                    cand = queue.pop(0)
+                    if cand in tried:
+                        continue
+                    tried.add(cand)
                     try:
                         try:
                             await recv.action("Stop").async_call()
@@ -329,24 +692,7 @@ class LinnSongcastGrouper:
                             # Prefer SOAP for ohz SetSender/Play to bypass metadata quirks
                             try:
                                 url = f"http://{receiver_ip}:55178/{receiver_udn}/av.openhome.org-Receiver-1/control"
-                                hdrs_set = {
-                                    "SOAPACTION": '"urn:av-openhome-org:service:Receiver:1#SetSender"',
-                                    "Content-Type": 'text/xml; charset="utf-8"'
-                                }
-                                msg_set = f"""<?xml version=\"1.0\" encoding=\"utf-8\"?>
-    <s:Envelope s:encodingStyle=\"http://schemas.xmlsoap.org/soap/encoding/\" xmlns:s=\"http://schemas.xmlsoap.org/soap/envelope/\">\n    <s:Body>\n        <u:SetSender xmlns:u=\"urn:av-openhome-org:service:Receiver:1\">\n            <Uri>{cand}</Uri>\n            <Metadata></Metadata>\n        </u:SetSender>\n    </s:Body>\n</s:Envelope>"""
-                                requests.post(url, headers=hdrs_set, data=msg_set, timeout=3)
-                                hdrs_play = {
-                                    "SOAPACTION": '"urn:av-openhome-org:service:Receiver:1#Play"',
-                                    "Content-Type": 'text/xml; charset="utf-8"'
-                                }
-                                msg_play = """<?xml version="1.0" encoding="utf-8"?>
-    <s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-        <s:Body>
-            <u:Play xmlns:u="urn:av-openhome-org:service:Receiver:1"></u:Play>
-        </s:Body>
-    </s:Envelope>"""
-                                requests.post(url, headers=hdrs_play, data=msg_play, timeout=3)
+                                await self._soap_set_sender_play(url, cand)
                             except Exception:
                                 # Fallback to API if SOAP fails
                                 try:
@@ -365,25 +711,62 @@ class LinnSongcastGrouper:
                                 await recv.action("Play").async_call()
                             except Exception:
                                 pass
-                        # Poll briefly and only accept if grouped is truly active
-                        for _ in range(8):
-                            await asyncio.sleep(0.5)
-                            try:
-                                ts = await recv.action("TransportState").async_call()
-                                state = (ts.get("TransportState") or ts.get("state") or "").lower()
-                                grouped_now = await self._is_grouped(receiver_dev)
-                                if self.debug:
-                                    print(f"  State={state}, grouped={grouped_now}, cand={cand}")
-                                if grouped_now or (str(cand).lower().startswith("ohz://") and state in ("playing", "buffering", "connecting")):
-                                    ok = True
-                                    uri = cand
+                        # Confirm the join. Prefer the push-driven LPEC wait:
+                        # the device reports its new Sender/TransportState the
+                        # moment it changes, so confirmation costs one event
+                        # instead of up to 8 polls at 0.5s. The SOAP poll
+                        # remains the fallback when lpec_utils is missing.
+                        cand_is_ohz = str(cand).lower().startswith("ohz://")
+                        if LPEC_AVAILABLE:
+                            # Mirrors _is_grouped: an ohz/ohu Sender URI is
+                            # conclusive by itself, while ohSongcast joins
+                            # confirm through an active transport state
+                            def _joined(state):
+                                sender_uri = (state.get("Sender") or "").lower()
+                                ts_l = (state.get("TransportState") or "").lower()
+                                return sender_uri.startswith(("ohz://", "ohu://")) or (
+                                    ts_l in ("playing", "buffering", "connecting"))
+                            confirmed, lstate = await await_receiver_state(
+                                receiver_ip, _joined, timeout=4.0)
+                            if self.debug:
+                                dbg.append(f"  LPEC confirmed={confirmed}, cand={cand}")
+                            if confirmed:
+                                ok = True
+                                uri = cand
+                        else:
+                            # Adaptive backoff: most joins report within the
+                            # first couple of hundred ms, so start at 50ms and
+                            # double up to 0.8s (~2.15s worst case) instead of
+                            # eight flat 0.5s sleeps (4s worst case).
+                            for delay in (0.05, 0.1, 0.2, 0.4, 0.8, 0.8):
+                                await asyncio.sleep(delay)
+                                try:
+                                    ts = await recv.action("TransportState").async_call()
+                                    state = (ts.get("TransportState") or ts.get("state") or "").lower()
+                                    grouped_now = await self._is_grouped(receiver_dev)
+                                    if self.debug:
+                                        dbg.append(f"  State={state}, grouped={grouped_now}, cand={cand}")
+                                    if grouped_now or (cand_is_ohz and state in ("playing", "buffering", "connecting")):
+                                        ok = True
+                                        uri = cand
+                                        break
+                                except Exception:
                                     break
-                            except Exception:
-                                break
                         if ok:
                             break
                     except Exception:
-                        continue
+                        pass
+                    if ohz_task is not None and ohz_task.done():
+                        try:
+                            disc = ohz_task.result()
+                        except Exception:
+                            disc = None
+                        if disc and disc not in tried:
+                            queue.insert(0, disc)
+                if ohz_task is not None and not ohz_task.done():
+                    ohz_task.cancel()
+                if dbg:
+                    sys.stdout.write("\n".join(dbg) + "\n")
                 print(f"✓ Receiver join attempted via Uri {uri}")
                 try:
                     sres_final = await recv.action("Sender").async_call()
@@ -391,46 +774,122 @@ class LinnSongcastGrouper:
                     print(f"Final Receiver.Sender Uri: {uri_final}")
                 except Exception:
                     pass
-                # SOAP fallback: force ohz SetSender + Play
-                try:
-                    url = f"http://{receiver_ip}:55178/{receiver_udn}/av.openhome.org-Receiver-1/control"
-                    default_ohz = f"ohz://239.255.255.250:51972/{sender_udn}"
-                    hdrs_set = {
-                        "SOAPACTION": '"urn:av-openhome-org:service:Receiver:1#SetSender"',
-                        "Content-Type": 'text/xml; charset="utf-8"'
-                    }
-                    msg_set = f"""<?xml version=\"1.0\" encoding=\"utf-8\"?>
-    <s:Envelope s:encodingStyle=\"http://schemas.xmlsoap.org/soap/encoding/\" xmlns:s=\"http://schemas.xmlsoap.org/soap/envelope/\">\n    <s:Body>\n        <u:SetSender xmlns:u=\"urn:av-openhome-org:service:Receiver:1\">\n            <Uri>{default_ohz}</Uri>\n            <Metadata></Metadata>\n        </u:SetSender>\n    </s:Body>\n</s:Envelope>"""
-                    requests.post(url, headers=hdrs_set, data=msg_set, timeout=3)
-                    hdrs_play = {
-                        "SOAPACTION": '"urn:av-openhome-org:service:Receiver:1#Play"',
-                        "Content-Type": 'text/xml; charset="utf-8"'
-                    }
-                    msg_play = """<?xml version="1.0" encoding="utf-8"?>
-    <s:Envelope s:encodingStyle="http://schemas.xmlsoap.org/soap/encoding/" xmlns:s="http://schemas.xmlsoap.org/soap/envelope/">
-        <s:Body>
-            <u:Play xmlns:u="urn:av-openhome-org:service:Receiver:1"></u:Play>
-        </s:Body>
-    </s:Envelope>"""
-                    requests.post(url, headers=hdrs_play, data=msg_play, timeout=3)
-                except Exception:
-                    pass
+                # SOAP fallback: force ohz SetSender + Play, but only when no
+                # candidate actually stuck - on success this pair just repeated
+                # what already worked, costing two extra round-trips.
+                if not ok:
+                    try:
+                        url = f"http://{receiver_ip}:55178/{receiver_udn}/av.openhome.org-Receiver-1/control"
+                        await self._soap_set_sender_play(url, sender_desc["default_ohz"])
+                    except Exception:
+                        pass
                 return True
             except Exception as e:
                 print(f"⚠ Receiver join failed: {e}")
                 return False
 
+        async def _configure_receiver(self, sl, sdev, sender_desc):
+            """Wake, source-switch, join and verify one initialised receiver.
+
+            Runs concurrently with the other receivers (every step is network
+            wait on an independent device); prints are prefixed with the
+            receiver name so interleaved output stays readable. Returns
+            (name, ok).
+            """
+            s_ip = sl.get("ip")
+            s_udn = sl.get("udn")
+            if isinstance(sdev, BaseException):
+                print(f"[{s_ip}] ✗ Receiver init failed: {sdev}")
+                return s_ip, False
+
+            # Resolve receiver name from device.xml; fallback to IP
+            s_name = await self._resolve_device_name(sdev, fallback=s_ip)
+            tag = f"[{s_name}]"
+            ok = True
+            print(f"\n{tag} === Configuring receiver {s_name} ({s_ip}) ===")
+            # Woken alongside the sender in create_songcast_group_async;
+            # just wait for the standby flag to clear
+            print(f"{tag} 2. Waiting for receiver to leave standby...")
+
+            async def _awake():
+                return not await sdev.is_in_standby()
+            await self._await_ready(_awake)
+
+            print(f"{tag} 3. Ensuring receiver source is Songcast...")
+            await self.set_source_to_songcast(sdev, s_name, udn=s_udn)
+
+            async def _on_songcast():
+                cur = await self._get_current_source_info(sdev)
+                return bool(cur and cur["flags"] & _SRC_RECV)
+            await self._await_ready(_on_songcast)
+            # Small status line: report current source index/name
+            cur_info = await self._get_current_source_info(sdev)
+            if cur_info:
+                print(f"{tag} Status: source index {cur_info['index']} ({cur_info['name']})")
+            else:
+                print(f"{tag} Status: source unknown")
+
+            print(f"{tag} 4. Joining receiver to sender...")
+            joined = await self._receiver_join(sdev, sender_desc, s_ip, s_udn)
+            if not joined:
+                print(f"{tag} ⚠ Receiver join did not complete; receiver UI may prompt for sender selection.")
+
+            print(f"{tag} 5. Verifying Songcast configuration...")
+
+            # First check: openhomedevice API grouping status
+            grouped = await self._is_grouped(sdev)
+            if grouped:
+                print(f"{tag} ✓ API Check: Receiver reports grouped (ohz/transport active)")
+            else:
+                print(f"{tag} ⚠ API Check: Receiver not grouped (no ohz/transport idle)")
+                ok = False
+
+            # Second check: LPEC real-time state verification. wait_for_state
+            # blocks on its socket, so run it in a worker thread to keep the
+            # other receivers' configuration moving.
+            if LPEC_AVAILABLE:
+                print(f"{tag}   Verifying via LPEC...")
+                success, final_state = await asyncio.to_thread(
+                    wait_for_state,
+                    s_ip,
+                    {'TransportState': 'Playing'},
+                    timeout=8.0,
+                    poll_interval=0.5
+                )
+
+                if success:
+                    print(f"{tag} ✓ LPEC Verification: Device reached Playing state")
+                    print(f"{tag}   Final state: {format_state_summary(final_state)}")
+                else:
+                    print(f"{tag} ⚠ LPEC Verification: Device did not reach Playing state within timeout")
+                    if final_state:
+                        print(f"{tag}   Last state: {format_state_summary(final_state)}")
+                    else:
+                        print(f"{tag}   Could not query device state (offline or telnet disabled?)")
+                    ok = False
+            else:
+                print(f"{tag}   (LPEC verification skipped - lpec_utils module not available)")
+
+            return s_name, ok
+
         async def create_songcast_group_async(self):
             print("=== Linn OpenHome Songcast Group Creator ===", flush=True)
             if not self.receivers:
                 print("No receivers specified.")
                 return False
 
-            # Init sender and resolve name from device.xml
-            try:
-                mdev = await self._init_dev(self.sender_ip, self.sender_udn)
-            except Exception as e:
-                print(f"✗ Sender initialization failed: {e}")
+            # Init sender and all receivers concurrently - each Device.init()
+            # is a description fetch + parse that is pure network wait, so the
+            # whole phase costs one init time instead of N+1. Receiver init
+            # failures are carried into _configure_receiver as exceptions and
+            # reported there.
+            mdev, *sdevs = await asyncio.gather(
+                self._init_dev(self.sender_ip, self.sender_udn),
+                *(self._init_dev(sl["ip"], sl["udn"]) for sl in self.receivers),
+                return_exceptions=True,
+            )
+            if isinstance(mdev, BaseException):
+                print(f"✗ Sender initialization failed: {mdev}")
                 return False
             self.sender_name = await self._resolve_device_name(mdev, fallback=self.sender_ip)
             print(f"Sender: {self.sender_name} ({self.sender_ip})")
@@ -438,79 +897,45 @@ class LinnSongcastGrouper:
                 print(f"Receiver:  {sl.get('ip')} ({sl.get('ip')})")
             print("-" * 50)
 
-            # Wake sender
-            print("\n1. Waking sender from standby...")
-            await self.wake_device(mdev, self.sender_name)
-            await asyncio.sleep(1.0)
-
+            # Wake the sender and every receiver in one gather: the wakes are
+            # independent I/O, and only the join step actually depends on the
+            # sender being up, so the wake phase costs one wake instead of N+1
+            print("\n1. Waking devices from standby...")
+            wake_jobs = [self.wake_device(mdev, self.sender_name)]
+            for sl, sdev in zip(self.receivers, sdevs):
+                if not isinstance(sdev, BaseException):
+                    wake_jobs.append(self.wake_device(
+                        sdev, getattr(sdev, "_cached_name", None) or sl.get("ip")))
+            await asyncio.gather(*wake_jobs, return_exceptions=True)
+
+            async def _sender_awake():
+                return not await mdev.is_in_standby()
+            await self._await_ready(_sender_awake)
+
+            # Sender-side join parameters (room/name/URI/metadata) are shared
+            # by every receiver; resolve them once now the sender is awake.
+            sender_desc = await self._resolve_sender_descriptor(mdev)
+
+            # Configure every receiver concurrently: each one is independent
+            # network wait, so wall-clock is the slowest receiver rather than
+            # the sum of all of them.
+            results = await asyncio.gather(
+                *(self._configure_receiver(sl, sdev, sender_desc)
+                  for sl, sdev in zip(self.receivers, sdevs)),
+                return_exceptions=True,
+            )
             all_ok = True
-            for sl in self.receivers:
-                s_ip = sl.get("ip")
-                s_udn = sl.get("udn")
-                s_name = None
-                try:
-                    sdev = await self._init_dev(s_ip, s_udn)
-                except Exception as e:
-                    print(f"✗ Receiver init failed: {e}")
+            for sl, r in zip(self.receivers, results):
+                if isinstance(r, BaseException):
+                    print(f"✗ Receiver {sl.get('ip')} configuration failed: {r}")
                     all_ok = False
-                    continue
-
-
-                # Resolve receiver name from device.xml; fallback to IP
-                s_name = await self._resolve_device_name(sdev, fallback=s_ip)
-                print(f"\n=== Configuring receiver {s_name} ({s_ip}) ===")
-                print("2. Waking receiver from standby...")
-                await self.wake_device(sdev, s_name)
-                await asyncio.sleep(1.0)
-
-                print("3. Ensuring receiver source is Songcast...")
-                await self.set_source_to_songcast(sdev, s_name)
-                await asyncio.sleep(1.0)
-                # Small status line: report current source index/name
-                cur_info = await self._get_current_source_info(sdev)
-                if cur_info:
-                    print(f"Status: {s_name} source index {cur_info['index']} ({cur_info['name']})")
-                else:
-                    print(f"Status: {s_name} source unknown")
-
-                print("4. Joining receiver to sender...")
-                joined = await self._receiver_join(sdev, mdev, s_ip, s_udn, self.sender_udn, self.sender_name)
-                if not joined:
-                    print("⚠ Receiver join did not complete; receiver UI may prompt for sender selection.")
-
-                print("5. Verifying Songcast configuration...")
-                
-                # First check: openhomedevice API grouping status
-                grouped = await self._is_grouped(sdev)
-                if grouped:
-                    print("✓ API Check: Receiver reports grouped (ohz/transport active)")
-                else:
-                    print("⚠ API Check: Receiver not grouped (no ohz/transport idle)")
+                elif not r[1]:
                     all_ok = False
-                
-                # Second check: LPEC real-time state verification
-                if LPEC_AVAILABLE:
-                    print("  Verifying via LPEC...")
-                    success, final_state = wait_for_state(
-                        s_ip,
-                        {'TransportState': 'Playing'},
-                        timeout=8.0,
-                        poll_interval=0.5
-                    )
-                    
-                    if success:
-                        print(f"✓ LPEC Verification: Device reached Playing state")
-                        print(f"  Final state: {format_state_summary(final_state)}")
-                    else:
-                        print(f"⚠ LPEC Verification: Device did not reach Playing state within timeout")
-                        if final_state:
-                            print(f"  Last state: {format_state_summary(final_state)}")
-                        else:
-                            print(f"  Could not query device state (offline or telnet disabled?)")
-                        all_ok = False
-                else:
-                    print("  (LPEC verification skipped - lpec_utils module not available)")
 
+            # Close the shared SOAP sessions inside the running loop
+            if self._http is not None and not self._http.closed:
+                await self._http.close()
+            self._session.close()
 
             print("\n" + "=" * 50)
             if all_ok:
@@ -33,6 +33,8 @@ LPEC Protocol:
 - Docs: https://docs.linn.co.uk/wiki/index.php/Developer:LPEC
 """
 
+import heapq
+import selectors
 import socket
 import sys
 import re
@@ -49,6 +51,41 @@ try:
 except Exception:
     pass
 
+# Hot-path LPEC patterns, compiled once at import. Every event used to run
+# four separate re.search calls - four pattern-cache lookups and four full
+# scans of the line; one finditer pass pulls out all tracked variables in a
+# single scan.
+_EVENT_HEADER_RE = re.compile(r'^EVENT\s+(\d+)\s+(.+)$')
+_EVENT_VAR_RE = re.compile(r'(TransportState|Sender|Status|ProtocolInfo)\s+"([^"]*)"')
+
+# Bytes twins of the event patterns for the receive hot path: LPEC is
+# ASCII on the wire, so matching the raw bytes and decoding only the
+# captured values skips a full decode+copy of every received line
+_EVENT_HEADER_B = re.compile(rb'^EVENT\s+(\d+)\s+(.+)$')
+_EVENT_VAR_B = re.compile(rb'(TransportState|Sender|Status|ProtocolInfo)\s+"([^"]*)"')
+
+# URI display patterns for _format_uri, compiled once instead of per
+# logged Sender change
+_OHZ_HOST_RE = re.compile(r'ohz://([^/]+)')
+_URI_ROOM_RE = re.compile(r'room=([^&]+)')
+
+# KEY=value .env lines, matched in one pass over the file (see
+# load_env_config); the value group stops at '#' to drop inline comments
+_ENV_LINE_RE = re.compile(r'^\s*([A-Za-z_][A-Za-z0-9_]*)\s*=\s*([^\n#]*)', re.M)
+
+# Timestamp prefix cached per wall-clock second: event bursts log many
+# lines within the same second, so strftime runs once per second and only
+# the millisecond suffix is formatted per line - no datetime allocation
+_LAST_SEC = [0, ""]
+
+def _timestamp() -> str:
+    t = time.time()
+    s = int(t)
+    if s != _LAST_SEC[0]:
+        _LAST_SEC[0] = s
+        _LAST_SEC[1] = time.strftime("%H:%M:%S", time.localtime(s))
+    return f"{_LAST_SEC[1]}.{int((t - s) * 1000):03d}"
+
 class StateAssertion:
     """Represents an expected state change assertion"""
     def __init__(self, device_id: str, variable: str, expected_value: str, within_seconds: float = 10.0):
@@ -63,7 +100,11 @@ class StateAssertion:
         
     def start(self):
         """Start the assertion timer"""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+
+    def deadline(self) -> float:
+        """Monotonic time at which this assertion expires"""
+        return (self.start_time or 0) + self.within_seconds
         
     def check(self, device_id: str, variable: str, value: str) -> bool:
         """Check if this assertion is met by the given state change"""
@@ -72,7 +113,7 @@ class StateAssertion:
             
         if device_id == self.device_id and variable == self.variable and value == self.expected_value:
             self.met = True
-            self.met_time = time.time()
+            self.met_time = time.monotonic()
             self.actual_value = value
             return True
         return False
@@ -81,7 +122,7 @@ class StateAssertion:
         """Check if assertion timeout has expired"""
         if not self.start_time or self.met:
             return False
-        return (time.time() - self.start_time) > self.within_seconds
+        return (time.monotonic() - self.start_time) > self.within_seconds
         
     def elapsed_time(self) -> Optional[float]:
         """Get elapsed time if met, otherwise None"""
@@ -99,10 +140,69 @@ class StateAssertion:
         else:
             return "⏳ PENDING"
 
+class EventHub:
+    """Single selector loop multiplexing every monitor's LPEC socket.
+
+    One background thread blocks in select() (epoll on Linux) across all
+    registered sockets and dispatches readable ones to their monitor's
+    _on_readable, replacing one blocking reader thread per device - N
+    kernel stacks and N GIL wakeups per event burst collapse into one.
+    """
+
+    def __init__(self):
+        self.sel = selectors.DefaultSelector()
+        self.thread = None
+        self.running = False
+
+    def register(self, monitor):
+        monitor.sock.setblocking(False)
+        self.sel.register(monitor.sock, selectors.EVENT_READ, monitor)
+
+    def unregister(self, monitor):
+        if monitor.sock is None:
+            return
+        try:
+            self.sel.unregister(monitor.sock)
+        except (KeyError, ValueError):
+            pass
+
+    def start(self):
+        self.running = True
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+        self.thread.start()
+
+    def _loop(self):
+        while self.running:
+            for key, _mask in self.sel.select(timeout=1):
+                mon = key.data
+                try:
+                    mon._on_readable()
+                except Exception as e:
+                    # A fault in one monitor's parsing must not take down
+                    # the shared loop: log it and halt just that monitor,
+                    # like the old per-device listener threads did
+                    try:
+                        mon.log(f"Listen error: {e}", "ERROR")
+                    except Exception:
+                        pass
+                    mon._halt()
+
+    def stop(self):
+        self.running = False
+        if self.thread and self.thread.is_alive():
+            self.thread.join(timeout=2)
+        try:
+            self.sel.close()
+        except Exception:
+            pass
+
+
 class DeviceMonitor:
     """Monitor a single device via LPEC subscription"""
     
-    def __init__(self, device_id: str, ip: str, udn: str, debug: bool = False, verbose: bool = False, assertions: Optional[List[StateAssertion]] = None):
+    def __init__(self, device_id: str, ip: str, udn: str, debug: bool = False, verbose: bool = False, assertions: Optional[List[StateAssertion]] = None,
+                 assertion_event: Optional[threading.Event] = None, shutdown_event: Optional[threading.Event] = None,
+                 hub: Optional[EventHub] = None):
         self.device_id = device_id
         self.ip = ip
         self.udn = udn
@@ -110,23 +210,55 @@ class DeviceMonitor:
         self.verbose = verbose
         self.sock = None
         self.running = False
-        self.thread = None
+        self.hub = hub
+        self._rxbuf = bytearray()
         self.state = {}
+        # Rendered state string, invalidated whenever state mutates, so
+        # logging unchanged state doesn't rebuild and re-join the parts
+        self._state_cache = None
         self.last_event_time = None
         self.assertions = assertions or []
+        # Assertions indexed by variable so event processing touches only the
+        # bucket for the variable that changed instead of scanning every
+        # assertion per change (device_id is fixed per monitor)
+        self._assert_idx: Dict[str, List[StateAssertion]] = {}
+        for a in self.assertions:
+            self._assert_idx.setdefault(a.variable, []).append(a)
+        # Signalled so main() can wait on events instead of sleep-polling:
+        # assertion_event fires when an assertion is met, shutdown_event when
+        # this monitor's listen loop exits
+        self.assertion_event = assertion_event
+        self.shutdown_event = shutdown_event
         
+    def _fmt(self, msg: str, level: str = "INFO") -> str:
+        """Format one timestamped log line"""
+        return f"[{_timestamp()}] [{self.device_id}:{self.ip}] {level}: {msg}"
+
     def log(self, msg: str, level: str = "INFO"):
         """Print timestamped log message"""
-        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-        prefix = f"[{timestamp}] [{self.device_id}:{self.ip}]"
-        print(f"{prefix} {level}: {msg}")
+        print(self._fmt(msg, level))
         
     def connect(self, port: int = 23, timeout: int = 5) -> bool:
         """Establish LPEC connection to device"""
         try:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.sock.settimeout(timeout)
-            
+            # LPEC events are small and frequent: disable Nagle so the
+            # device's replies are not held back up to 40ms, size the
+            # kernel receive buffer for bursts, and enable keepalive
+            # probes so a dead device surfaces as a socket error instead
+            # of indefinite silence
+            try:
+                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 262144)
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+                if hasattr(socket, 'TCP_KEEPIDLE'):
+                    self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30)
+                    self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+                    self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+            except Exception:
+                pass
+
             self.log(f"Connecting to port {port}...")
             self.sock.connect((self.ip, port))
             
@@ -211,32 +343,15 @@ class DeviceMonitor:
         """Parse initial EVENT 0 to populate current state"""
         for line in buffer.splitlines():
             line = line.strip()
-            if not line.startswith("EVENT"):
+            if _EVENT_HEADER_RE.match(line) is None:
                 continue
-                
-            # Extract key state variables
+
+            # Extract key state variables in one scan
             # Format: EVENT <seq> <service> <variable> <value> [<variable> <value> ...]
-            
-            # TransportState
-            m = re.search(r'TransportState\s+"([^"]*)"', line)
-            if m:
-                self.state['TransportState'] = m.group(1)
-                
-            # Sender (URI)
-            m = re.search(r'Sender\s+"([^"]*)"', line)
-            if m:
-                self.state['Sender'] = m.group(1)
-                
-            # Status
-            m = re.search(r'Status\s+"([^"]*)"', line)
-            if m:
-                self.state['Status'] = m.group(1)
-                
-            # ProtocolInfo
-            m = re.search(r'ProtocolInfo\s+"([^"]*)"', line)
-            if m:
-                self.state['ProtocolInfo'] = m.group(1)
-                
+            for m in _EVENT_VAR_RE.finditer(line):
+                self.state[m.group(1)] = m.group(2)
+                self._state_cache = None
+
         # Display initial state
         if self.state:
             self.log(f"Initial state: {self._format_state()}")
@@ -244,7 +359,9 @@ class DeviceMonitor:
             self.log("No initial state received", "WARNING")
             
     def _format_state(self) -> str:
-        """Format current state for display"""
+        """Format current state for display (cached until state mutates)"""
+        if self._state_cache is not None:
+            return self._state_cache
         parts = []
         if 'TransportState' in self.state:
             parts.append(f"Transport={self.state['TransportState']}")
@@ -262,125 +379,131 @@ class DeviceMonitor:
                 parts.append(f"Sender={sender}")
         if 'Status' in self.state:
             parts.append(f"Status={self.state['Status']}")
-        return ", ".join(parts) if parts else "No state"
-        
-    def listen(self):
-        """Listen for LPEC events in a loop"""
-        self.running = True
-        buffer = ""
-        
-        # Set socket to blocking mode with longer timeout for event listening
-        self.sock.settimeout(30)
+        self._state_cache = ", ".join(parts) if parts else "No state"
+        return self._state_cache
         
-        self.log("Listening for events...")
-        
-        while self.running:
-            try:
-                chunk = self.sock.recv(4096).decode('utf-8', errors='ignore')
-                if not chunk:
-                    self.log("Connection closed by device", "WARNING")
-                    break
-                    
-                buffer += chunk
-                
-                # Process complete lines
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    line = line.strip()
-                    
-                    if not line:
-                        continue
-                        
-                    # Process EVENT lines
-                    if line.startswith("EVENT"):
-                        self._process_event(line)
-                    elif self.verbose:
-                        self.log(f"Other: {line}", "DEBUG")
-                        
-            except socket.timeout:
-                # Timeout is normal - just continue listening
-                if self.verbose:
-                    self.log("Heartbeat (no events)", "DEBUG")
-                continue
-            except Exception as e:
-                if self.running:
-                    self.log(f"Listen error: {e}", "ERROR")
+    def _on_readable(self):
+        """Drain the socket and process complete lines.
+
+        Called from the EventHub selector thread whenever this monitor's
+        socket is readable. Buffers raw bytes in a bytearray (amortised O(1)
+        append, no per-chunk decode) and splits complete lines off the
+        front, decoding each one whole.
+        """
+        try:
+            chunk = self.sock.recv(65536)
+        except (BlockingIOError, InterruptedError):
+            return
+        except Exception as e:
+            if self.running:
+                self.log(f"Listen error: {e}", "ERROR")
+            self._halt()
+            return
+
+        if not chunk:
+            self.log("Connection closed by device", "WARNING")
+            self._halt()
+            return
+
+        self._rxbuf.extend(chunk)
+        while True:
+            nl = self._rxbuf.find(b'\n')
+            if nl < 0:
                 break
-                
+            raw = bytes(self._rxbuf[:nl]).strip()
+            del self._rxbuf[:nl + 1]
+
+            if not raw:
+                continue
+
+            # Match EVENT lines on the raw bytes; the anchored header
+            # pattern's literal prefix doubles as the startswith check,
+            # and only event payload values ever get decoded
+            m = _EVENT_HEADER_B.match(raw)
+            if m is not None:
+                self._process_event_bytes(m)
+            elif self.verbose:
+                self.log(f"Other: {raw.decode('utf-8', errors='ignore')}", "DEBUG")
+
+    def _halt(self):
+        """Deregister from the hub and flag this monitor as stopped.
+
+        Both events are signalled: the test-mode wait blocks on
+        assertion_event with deadline-sized timeouts, so it too must wake
+        when a monitor dies.
+        """
+        if self.hub is not None:
+            self.hub.unregister(self)
         self.running = False
-        
-    def _process_event(self, line: str):
-        """Process a single EVENT line and update state"""
-        self.last_event_time = datetime.now()
-        
-        # Parse event: EVENT <seq> <service> <variable> <value> [...]
-        match = re.match(r'^EVENT\s+(\d+)\s+(.+)$', line)
-        if not match:
-            if self.verbose:
-                self.log(f"Unparseable event: {line}", "DEBUG")
+        if self.shutdown_event is not None:
+            self.shutdown_event.set()
+        if self.assertion_event is not None:
+            self.assertion_event.set()
+
+    def _maybe_update(self, var: str, new_val: str, changes: dict):
+        """Record a state change, skipping writes of unchanged values.
+
+        Heartbeat-style events repeat the same values; the identity check
+        short-circuits interned strings before __eq__ runs, and unchanged
+        values never touch the state dict or allocate a change tuple.
+        """
+        old = self.state.get(var)
+        if old is new_val or old == new_val:
             return
-            
-        seq = match.group(1)
+        changes[var] = (old, new_val)
+        self.state[var] = new_val
+        self._state_cache = None
+
+    def _process_event_bytes(self, match: re.Match):
+        """Process an EVENT header match from the bytes hot path.
+
+        _on_readable matches the header on raw bytes; only the sequence
+        number and captured variable values are decoded, so undecoded
+        event text (service names, untracked variables) never leaves the
+        bytes domain.
+        """
+        self.last_event_time = datetime.now()
+
+        seq = match.group(1).decode('ascii')
         rest = match.group(2)
-        
-        # Extract variable changes
+
         changes = {}
-        
-        # TransportState
-        m = re.search(r'TransportState\s+"([^"]*)"', rest)
-        if m:
-            new_val = m.group(1)
-            old_val = self.state.get('TransportState')
-            if new_val != old_val:
-                changes['TransportState'] = (old_val, new_val)
-                self.state['TransportState'] = new_val
-                
-        # Sender
-        m = re.search(r'Sender\s+"([^"]*)"', rest)
-        if m:
-            new_val = m.group(1)
-            old_val = self.state.get('Sender')
-            if new_val != old_val:
-                changes['Sender'] = (old_val, new_val)
-                self.state['Sender'] = new_val
-                
-        # Status
-        m = re.search(r'Status\s+"([^"]*)"', rest)
-        if m:
-            new_val = m.group(1)
-            old_val = self.state.get('Status')
-            if new_val != old_val:
-                changes['Status'] = (old_val, new_val)
-                self.state['Status'] = new_val
-                
-        # ProtocolInfo
-        m = re.search(r'ProtocolInfo\s+"([^"]*)"', rest)
-        if m:
-            new_val = m.group(1)
-            old_val = self.state.get('ProtocolInfo')
-            if new_val != old_val:
-                changes['ProtocolInfo'] = (old_val, new_val)
-                self.state['ProtocolInfo'] = new_val
-                
-        # Display changes
+        for m in _EVENT_VAR_B.finditer(rest):
+            self._maybe_update(m.group(1).decode('ascii'),
+                               m.group(2).decode('utf-8', errors='ignore'),
+                               changes)
+
+        self._report_changes(seq, changes)
+
+    def _report_changes(self, seq: str, changes: Dict[str, Tuple[Optional[str], str]]):
+        """Display state changes and run the matching assertions.
+
+        The whole event block goes out as one stdout write: a multi-variable
+        change used to issue a print (lock acquire + write syscall) per
+        line, which interleaved badly under bursts.
+        """
         if changes:
-            self.log(f"⚡ STATE CHANGE (seq={seq}):", "EVENT")
+            out = [self._fmt(f"⚡ STATE CHANGE (seq={seq}):", "EVENT")]
             for var, (old, new) in changes.items():
                 # Format output based on variable
                 if var == 'Sender':
                     # Show protocol scheme and brief info
                     old_str = self._format_uri(old) if old else "None"
                     new_str = self._format_uri(new) if new else "None"
-                    self.log(f"  {var}: {old_str} → {new_str}", "EVENT")
+                    out.append(self._fmt(f"  {var}: {old_str} → {new_str}", "EVENT"))
                 else:
-                    self.log(f"  {var}: {old} → {new}", "EVENT")
-                    
-                # Check assertions
-                for assertion in self.assertions:
+                    out.append(self._fmt(f"  {var}: {old} → {new}", "EVENT"))
+
+                # Check only the assertions watching this variable
+                for assertion in self._assert_idx.get(var, ()):
                     if assertion.check(self.device_id, var, new):
                         elapsed = assertion.elapsed_time()
-                        self.log(f"  ✓ Assertion met: {var}={new} (after {elapsed:.2f}s)", "ASSERT")
-                        
+                        out.append(self._fmt(f"  ✓ Assertion met: {var}={new} (after {elapsed:.2f}s)", "ASSERT"))
+                        if self.assertion_event is not None:
+                            self.assertion_event.set()
+
+            sys.stdout.write("\n".join(out) + "\n")
+
         elif self.verbose:
             # No changes but log the event in verbose mode
             self.log(f"Event #{seq} (no changes)", "DEBUG")
@@ -391,13 +514,13 @@ class DeviceMonitor:
             return "None"
         if uri.startswith('ohz://'):
             # Extract multicast address if present
-            m = re.search(r'ohz://([^/]+)', uri)
+            m = _OHZ_HOST_RE.search(uri)
             if m:
                 return f"ohz://{m.group(1)}/..."
             return "ohz://..."
         elif uri.startswith('ohSongcast://'):
             # Extract room/name if present
-            m = re.search(r'room=([^&]+)', uri)
+            m = _URI_ROOM_RE.search(uri)
             room = m.group(1) if m else "?"
             return f"ohSongcast://[{room}]"
         elif len(uri) > 60:
@@ -405,32 +528,44 @@ class DeviceMonitor:
         return uri
         
     def start(self) -> bool:
-        """Start monitoring in background thread"""
+        """Connect, subscribe and register with the event hub"""
         if not self.connect():
             return False
-            
+
         if not self.subscribe():
             self.close()
             return False
-            
-        self.thread = threading.Thread(target=self.listen, daemon=True)
-        self.thread.start()
+
+        self.running = True
+        self.hub.register(self)
+        self.log("Listening for events...")
         return True
-        
+
     def stop(self):
         """Stop monitoring and close connection"""
         self.log("Stopping monitor...")
         self.running = False
-        if self.thread and self.thread.is_alive():
-            self.thread.join(timeout=2)
+        if self.hub is not None:
+            self.hub.unregister(self)
         self.close()
         
     def close(self):
-        """Close socket connection"""
+        """Shut down and close the socket connection.
+
+        shutdown(SHUT_RDWR) first: it immediately fails any in-flight read
+        on the connection and signals the device the session is over,
+        instead of leaving teardown to close() semantics alone. Only
+        OSError is swallowed - a socket already reset by the peer raises
+        it and that is fine here.
+        """
         if self.sock:
+            try:
+                self.sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
             try:
                 self.sock.close()
-            except:
+            except OSError:
                 pass
             self.sock = None
 
@@ -450,29 +585,23 @@ def load_env_config(env_path: str = '.env') -> Tuple[Optional[Dict], Optional[Li
         
     try:
         with open(env_path, 'r') as f:
-            for raw in f:
-                line = raw.strip()
-                if not line or line.startswith('#'):
-                    continue
-                # Strip inline comments
-                if '#' in line:
-                    line = line.split('#', 1)[0].strip()
-                if not line or '=' not in line:
-                    continue
-                    
-                key, val = line.split('=', 1)
-                key = key.strip()
-                val = val.strip()
-                
-                if key.startswith('DEVICE'):
-                    parts = val.split()
-                    if len(parts) >= 2:
-                        devices[key] = {"id": key, "ip": parts[0], "udn": parts[1]}
-                elif key in ('SONGCAST_MASTER', 'SONGCAST_SENDER'):
-                    master_id = val.strip()
-                elif key in ('SONGCAST_MEMBERS', 'SONGCAST_RECEIVERS'):
-                    member_ids = [v.strip() for v in val.split(',') if v.strip()]
-                    
+            data = f.read()
+        # One compiled-regex pass over the whole file instead of per-line
+        # strip/split/startswith tokenisation; the value group stops at '#'
+        # so inline comments are dropped and comment/blank lines never match
+        for m in _ENV_LINE_RE.finditer(data):
+            key = m.group(1)
+            val = m.group(2).strip()
+
+            if key.startswith('DEVICE'):
+                parts = val.split()
+                if len(parts) >= 2:
+                    devices[key] = {"id": key, "ip": parts[0], "udn": parts[1]}
+            elif key in ('SONGCAST_MASTER', 'SONGCAST_SENDER'):
+                master_id = val
+            elif key in ('SONGCAST_MEMBERS', 'SONGCAST_RECEIVERS'):
+                member_ids = [v.strip() for v in val.split(',') if v.strip()]
+
     except Exception as e:
         print(f"✗ Error reading {env_path}: {e}")
         return None, []
@@ -590,19 +719,30 @@ Notes:
         print(f"    - {m['id']} ({m['ip']}) [{device_type}]")
     print()
     
+    # Events the hub thread signals so the main thread can block on them
+    # instead of waking every 0.5-1s to poll
+    assertion_event = threading.Event()
+    shutdown_event = threading.Event()
+
+    # One selector thread services every monitor's socket
+    hub = EventHub()
+
     # Create monitors for each device (sender + receivers)
     monitors = []
     for device in all_devices:
         # Filter assertions for this device
         device_assertions = [a for a in assertions if a.device_id == device['id']]
-        
+
         mon = DeviceMonitor(
             device_id=device['id'],
             ip=device['ip'],
             udn=device['udn'],
             debug=args.debug,
             verbose=args.verbose,
-            assertions=device_assertions
+            assertions=device_assertions,
+            assertion_event=assertion_event,
+            shutdown_event=shutdown_event,
+            hub=hub
         )
         monitors.append(mon)
         
@@ -611,14 +751,16 @@ Notes:
     print("-" * 70)
     print()
     
+    hub.start()
     active_monitors = []
     for mon in monitors:
         if mon.start():
             active_monitors.append(mon)
         else:
             print(f"✗ Failed to start monitor for {mon.device_id}")
-            
+
     if not active_monitors:
+        hub.stop()
         print("\n✗ No monitors started successfully")
         sys.exit(1)
     
@@ -640,17 +782,26 @@ Notes:
     # Keep main thread alive
     try:
         if test_mode:
-            # In test mode, wait for all assertions to complete or timeout
-            while assertions:
-                time.sleep(0.5)
-                # Check if all assertions are met or expired
-                all_done = all(a.met or a.is_expired() for a in assertions)
-                if all_done:
+            # In test mode, wait for all assertions to complete or time out.
+            # A deadline heap orders the expiries, so each wait blocks until
+            # either an assertion fires (assertion_event, also set when a
+            # monitor halts) or exactly the next deadline - no fixed-rate
+            # polling and no O(assertions) scan per wake.
+            heap = [(a.deadline(), i, a) for i, a in enumerate(assertions)]
+            heapq.heapify(heap)
+            while heap:
+                # Discard met assertions and expired heads
+                while heap and (heap[0][2].met or heap[0][2].is_expired()):
+                    heapq.heappop(heap)
+                if not heap:
                     break
                 # Check if any monitors have stopped
                 if not any(m.running for m in active_monitors):
                     print("\n✗ All monitors have stopped")
                     break
+                timeout = max(0.0, heap[0][0] - time.monotonic())
+                assertion_event.wait(timeout=timeout)
+                assertion_event.clear()
             
             # Test complete - show results
             print("\n")
@@ -673,14 +824,13 @@ Notes:
             
             exit_code = 0 if failed == 0 else 1
         else:
-            # Normal monitoring mode
-            while True:
-                time.sleep(1)
-                # Check if any monitors have stopped
-                if not any(m.running for m in active_monitors):
-                    print("\n✗ All monitors have stopped")
-                    break
-            
+            # Normal monitoring mode: block until a monitor thread signals
+            # rather than waking every second to poll
+            while any(m.running for m in active_monitors):
+                shutdown_event.wait()
+                shutdown_event.clear()
+            print("\n✗ All monitors have stopped")
+
             exit_code = 0
     except KeyboardInterrupt:
         print("\n")
@@ -689,10 +839,11 @@ Notes:
         print("-" * 70)
         exit_code = 0
         
-    # Stop all monitors
+    # Stop all monitors, then the hub thread servicing them
     for mon in active_monitors:
         mon.stop()
-        
+    hub.stop()
+
     print()
     print("✓ Shutdown complete")
     